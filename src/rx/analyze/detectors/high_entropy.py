@@ -68,6 +68,15 @@ class HighEntropyDetector(AnomalyDetector):
         re.compile(r'AKIA[0-9A-Z]{16}'),
     ]
 
+    # Patterns used to pick a human-readable description, in priority order
+    DESCRIPTION_PATTERNS = [
+        (re.compile(r'eyJ[A-Za-z0-9_-]+\.eyJ'), 'JWT token detected'),
+        (re.compile(r'AKIA[0-9A-Z]{16}'), 'AWS access key detected'),
+        (re.compile(r'[a-fA-F0-9]{64}'), 'SHA256 hash detected'),
+        (re.compile(r'[a-fA-F0-9]{40}'), 'SHA1 hash detected'),
+        (re.compile(r'[a-fA-F0-9]{32}'), 'MD5 hash detected'),
+    ]
+
     # Patterns to exclude (common false positives)
     EXCLUDE_PATTERNS = [
         re.compile(r'@'),  # Email addresses
@@ -188,16 +197,9 @@ class HighEntropyDetector(AnomalyDetector):
                 return 'Potential secret in context'
 
         # Check for specific patterns
-        if re.search(r'eyJ[A-Za-z0-9_-]+\.eyJ', first_line):
-            return 'JWT token detected'
-        if re.search(r'AKIA[0-9A-Z]{16}', first_line):
-            return 'AWS access key detected'
-        if re.search(r'[a-fA-F0-9]{64}', first_line):
-            return 'SHA256 hash detected'
-        if re.search(r'[a-fA-F0-9]{40}', first_line):
-            return 'SHA1 hash detected'
-        if re.search(r'[a-fA-F0-9]{32}', first_line):
-            return 'MD5 hash detected'
+        for pattern, description in self.DESCRIPTION_PATTERNS:
+            if pattern.search(first_line):
+                return description
 
         return 'High-entropy string detected'
 
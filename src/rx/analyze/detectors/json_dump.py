@@ -49,6 +49,9 @@ class JsonDumpDetector(AnomalyDetector):
     # Pattern to verify JSON-like key-value pairs
     JSON_KEY_VALUE_PATTERN = re.compile(r'"[^"]+"\s*:\s*(?:"[^"]*"|[\d.]+|true|false|null|\{|\[)')
 
+    # Closing structure lines like "}," or "],"
+    JSON_CLOSING_PATTERN = re.compile(r'^[\}\]]\s*,?\s*$')
+
     # Minimum length to consider it a meaningful JSON dump
     MIN_JSON_LENGTH = 100
 
@@ -150,7 +153,7 @@ class JsonDumpDetector(AnomalyDetector):
             return True
 
         # Lines that are just closing with values: "},", "],"
-        if re.match(r'^[\}\]]\s*,?\s*$', stripped):
+        if self.JSON_CLOSING_PATTERN.match(stripped):
             return True
 
         return False
@@ -63,6 +63,9 @@ class TracebackDetector(AnomalyDetector):
         re.compile(r'^\t'),  # Indented continuation
     ]
 
+    # Exception message lines like "ValueError: ..." following a traceback
+    EXCEPTION_MESSAGE_PATTERN = re.compile(r'^\w+(Error|Exception):')
+
     @property
     def name(self) -> str:
         return 'traceback'
@@ -116,7 +119,7 @@ class TracebackDetector(AnomalyDetector):
         # Also merge if previous was a traceback and this looks like an error message
         if prev_severity >= 0.9:
             # Check if this is an exception message (starts with exception name)
-            if re.match(r'^\w+(Error|Exception):', line):
+            if self.EXCEPTION_MESSAGE_PATTERN.match(line):
                 self._merge_count += 1
                 return True
 
@@ -151,6 +151,10 @@ def _prescan_chunk_worker(
         # Parse JSON output
         matches: list[PrescanMatch] = []
 
+        # Compile once up front; re.search(str, ...) would re-hit the re
+        # module cache for every pattern on every matched line
+        compiled_detectors = [(re.compile(pat), info) for pat, info in pattern_to_detector.items()]
+
         for line in rg_proc.stdout or []:
             try:
                 data = json.loads(line)
@@ -170,8 +174,8 @@ def _prescan_chunk_worker(
                 line_text = match_data.get('lines', {}).get('text', '')
 
                 # Find which detector this pattern belongs to
-                for pattern, (detector_name, severity) in pattern_to_detector.items():
-                    if re.search(pattern, line_text):
+                for pattern, (detector_name, severity) in compiled_detectors:
+                    if pattern.search(line_text):
                         matches.append(
                             PrescanMatch(
                                 line_num=-1,  # Will be calculated from offset
@@ -171,6 +171,9 @@ class TracebackDetector(AnomalyDetector):
         re.compile(r'^\t'),  # Indented continuation
     ]
 
+    # Exception message lines like "ValueError: ..." following a traceback
+    EXCEPTION_MESSAGE_PATTERN = re.compile(r'^\w+(Error|Exception):')
+
     @property
     def name(self) -> str:
         return 'traceback'
@@ -201,7 +204,7 @@ class TracebackDetector(AnomalyDetector):
         # Also merge if previous was a traceback and this looks like an error message
         if prev_severity >= 0.9:
             # Check if this is an exception message (starts with exception name)
-            if re.match(r'^\w+(Error|Exception):', line):
+            if self.EXCEPTION_MESSAGE_PATTERN.match(line):
                 return True
 
         return False
@@ -1031,6 +1034,10 @@ def _prescan_chunk_worker(
         # Parse JSON output
         matches: list[PrescanMatch] = []
 
+        # Compile once up front; re.search(str, ...) would re-hit the re
+        # module cache for every pattern on every matched line
+        compiled_detectors = [(re.compile(p), info) for p, info in pattern_to_detector.items()]
+
         for line in rg_proc.stdout or []:
             try:
                 data = json.loads(line)
@@ -1050,8 +1057,8 @@ def _prescan_chunk_worker(
                 line_text = match_data.get('lines', {}).get('text', '')
 
                 # Find which detector this pattern belongs to
-                for pattern, (detector_name, severity) in pattern_to_detector.items():
-                    if re.search(pattern, line_text):
+                for pattern, (detector_name, severity) in compiled_detectors:
+                    if pattern.search(line_text):
                         matches.append(
                             PrescanMatch(
                                 line_num=-1,  # Will be calculated from offset
@@ -1219,6 +1226,7 @@ class FileAnalysisState:
     # Metadata
     created_at: str | None = None
     modified_at: str | None = None
+    modified_at_ns: int | None = None
     permissions: str | None = None
     owner: str | None = None
 
@@ -1408,6 +1416,7 @@ class FileAnalyzer:
             is_text=data.get('is_text', False),
             created_at=data.get('created_at'),
             modified_at=data.get('modified_at'),
+            modified_at_ns=data.get('modified_at_ns'),
             permissions=data.get('permissions'),
             owner=data.get('owner'),
             line_count=data.get('line_count'),
@@ -1480,6 +1489,7 @@ class FileAnalyzer:
             'is_text': result.is_text,
             'created_at': result.created_at,
             'modified_at': result.modified_at,
+            'modified_at_ns': result.modified_at_ns,
             'permissions': result.permissions,
             'owner': result.owner,
             'line_count': result.line_count,
@@ -1521,6 +1531,7 @@ class FileAnalyzer:
             size_human=human_readable_size(idx.source_size_bytes),
             is_text=idx.is_text,
             modified_at=idx.source_modified_at,
+            modified_at_ns=idx.source_mtime_ns,
             permissions=idx.permissions,
             owner=idx.owner,
             line_count=idx.line_count,
@@ -1579,6 +1590,7 @@ class FileAnalyzer:
             version=UNIFIED_INDEX_VERSION,
             source_path=filepath,
             source_modified_at=result.modified_at or datetime.now().isoformat(),
+            source_mtime_ns=result.modified_at_ns,
             source_size_bytes=result.size_bytes,
             created_at=datetime.now().isoformat(),
             build_time_seconds=0.0,
@@ -1750,6 +1762,7 @@ class FileAnalyzer:
             # File metadata from stat
             result.created_at = datetime.fromtimestamp(stat_info.st_ctime).isoformat()
             result.modified_at = unified_idx.source_modified_at
+            result.modified_at_ns = unified_idx.source_mtime_ns
             result.permissions = unified_idx.permissions or oct(stat_info.st_mode)[-3:]
             result.owner = unified_idx.owner
 
@@ -1851,6 +1864,7 @@ class FileAnalyzer:
             # File metadata
             result.created_at = datetime.fromtimestamp(stat_info.st_ctime).isoformat()
             result.modified_at = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
+            result.modified_at_ns = stat_info.st_mtime_ns
             result.permissions = oct(stat_info.st_mode)[-3:]
 
             try:
@@ -248,6 +248,7 @@ def build_compressed_index(
         'version': UNIFIED_INDEX_VERSION,
         'source_path': str(source_path),
         'source_modified_at': source_mtime,
+        'source_mtime_ns': stat.st_mtime_ns,
         'source_size_bytes': source_size,
         'compression_format': compression_format.value,
         'decompressed_size_bytes': decompressed_size,
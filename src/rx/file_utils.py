@@ -2,6 +2,7 @@
 
 import logging
 import os
+import stat
 import subprocess
 import threading
 import time
@@ -25,9 +26,14 @@ MIN_CHUNK_SIZE = int(os.getenv('RX_MIN_CHUNK_SIZE_MB', str(20))) * 1024 * 1024
 MAX_FILES = int(os.getenv('RX_MAX_FILES', '1000'))  #
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileTask:
-    """Represents a unit of work for parallel processing"""
+    """Represents a unit of work for parallel processing.
+
+    Slotted and frozen: the scheduler builds one instance per chunk across
+    potentially thousands of files, so skipping the per-instance __dict__
+    keeps them compact, and tasks are never mutated after creation.
+    """
 
     task_id: int
     filepath: str
@@ -61,26 +67,43 @@ def scan_directory_for_text_files(dirpath: str, max_files: int = MAX_FILES) -> t
     logger.info(f'[SCAN] Scanning directory recursively: {dirpath}')
 
     try:
-        for root, dirs, files in os.walk(dirpath):
-            for filename in files:
+        # Iterative scandir walk. DirEntry caches the file type from the
+        # directory read itself, so the symlink and directory checks below
+        # cost no extra syscall per entry — os.walk + os.path.islink paid
+        # one lstat(2) for every file found.
+        pending = [dirpath]
+        while pending:
+            current = pending.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError as e:
+                # Match os.walk's default tolerance of unreadable subdirectories
+                logger.debug(f'[SCAN] Skipping unreadable directory {current}: {e}')
+                continue
+
+            for entry in entries:
+                # Descend into real directories; symlinked dirs fall through
+                # to the symlink check below and are skipped
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+
                 if len(text_files) + len(skipped_files) >= max_files:
                     logger.warning(f'[SCAN] Reached max_files limit ({max_files}), stopping scan')
                     return text_files, skipped_files
 
-                filepath = os.path.join(root, filename)
-
                 # Skip symlinks
-                if os.path.islink(filepath):
-                    logger.debug(f'[SCAN] Skipping symlink: {filepath}')
+                if entry.is_symlink():
+                    logger.debug(f'[SCAN] Skipping symlink: {entry.path}')
                     continue
 
                 # Check if text file
-                if is_text_file(filepath):
-                    text_files.append(filepath)
-                    logger.debug(f'[SCAN] Added text file: {filepath}')
+                if is_text_file(entry.path):
+                    text_files.append(entry.path)
+                    logger.debug(f'[SCAN] Added text file: {entry.path}')
                 else:
-                    skipped_files.append(filepath)
-                    logger.debug(f'[SCAN] Skipped binary file: {filepath}')
+                    skipped_files.append(entry.path)
+                    logger.debug(f'[SCAN] Skipped binary file: {entry.path}')
 
         logger.info(f'[SCAN] Completed: {len(text_files)} text files, {len(skipped_files)} skipped')
         return text_files, skipped_files
@@ -94,10 +117,13 @@ def validate_file(filepath: str) -> None:
     """Validate that a file exists and is processable (text or supported compressed format)."""
     from rx.compression import is_compressed
 
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f'File not found: {filepath}')
+    # Single stat call instead of separate exists/isfile checks (two syscalls)
+    try:
+        st = os.stat(filepath)
+    except OSError as e:
+        raise FileNotFoundError(f'File not found: {filepath}') from e
 
-    if not os.path.isfile(filepath):
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f'Path is not a file: {filepath}')
 
     # Accept compressed files (they appear binary but are processable)
@@ -112,10 +138,35 @@ def validate_file(filepath: str) -> None:
         raise ValueError('File appears to be binary, not text')
 
 
+def _find_next_newline_in_file(f, offset: int) -> int:
+    """
+    Find the position of the next newline after the given offset in an
+    already-open binary file. This ensures we split on line boundaries.
+
+    Args:
+        f: Binary file object
+        offset: Starting byte offset
+
+    Returns:
+        Byte position of next newline, or offset if at end of file
+    """
+    f.seek(offset)
+    # Read up to 256KB to find next newline
+    chunk = f.read(256 * 1024)
+    if not chunk:
+        return offset
+
+    newline_pos = chunk.find(NEWLINE_SYMBOL_BYTES)
+    if newline_pos == -1:
+        # No newline found in this chunk, return end of chunk
+        return offset + len(chunk)
+
+    return offset + newline_pos + len(NEWLINE_SYMBOL_BYTES)  # Position after the newline
+
+
 def find_next_newline(filename: str, offset: int) -> int:
     """
     Find the position of the next newline after the given offset.
-    This ensures we split on line boundaries.
 
     Args:
         filename: Path to the file
@@ -125,18 +176,7 @@ def find_next_newline(filename: str, offset: int) -> int:
         Byte position of next newline, or offset if at end of file
     """
     with open(filename, 'rb') as f:
-        f.seek(offset)
-        # Read up to 256KB to find next newline
-        chunk = f.read(256 * 1024)
-        if not chunk:
-            return offset
-
-        newline_pos = chunk.find(NEWLINE_SYMBOL_BYTES)
-        if newline_pos == -1:
-            # No newline found in this chunk, return end of chunk
-            return offset + len(chunk)
-
-        return offset + newline_pos + len(NEWLINE_SYMBOL_BYTES)  # Position after the newline
+        return _find_next_newline_in_file(f, offset)
 
 
 def get_file_offsets(filename: str, file_size_bytes: int) -> list[int]:
@@ -185,12 +225,16 @@ def get_file_offsets(filename: str, file_size_bytes: int) -> list[int]:
     raw_offsets = [i * chunk_size for i in range(num_chunks)]
     logger.debug(f'[OFFSETS] Generated raw offsets: {raw_offsets}')
 
-    # Adjust offsets to line boundaries (except first offset which is always 0)
+    # Adjust offsets to line boundaries (except first offset which is always 0).
+    # Open the file once and seek per offset instead of reopening it for
+    # every chunk boundary.
     aligned_offsets = [0]
-    for i in range(1, num_chunks):
-        aligned_offset = find_next_newline(filename, raw_offsets[i])
-        aligned_offsets.append(aligned_offset)
-        logger.debug(f'[OFFSETS] Aligned offset[{i}]: {raw_offsets[i]} -> {aligned_offset} (line boundary)')
+    if num_chunks > 1:
+        with open(filename, 'rb') as f:
+            for i in range(1, num_chunks):
+                aligned_offset = _find_next_newline_in_file(f, raw_offsets[i])
+                aligned_offsets.append(aligned_offset)
+                logger.debug(f'[OFFSETS] Aligned offset[{i}]: {raw_offsets[i]} -> {aligned_offset} (line boundary)')
 
     logger.debug(f'[OFFSETS] Final line-aligned offsets: {aligned_offsets}')
     return aligned_offsets
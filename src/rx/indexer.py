@@ -280,6 +280,7 @@ class FileIndexer:
         idx = UnifiedFileIndex(
             source_path=filepath,
             source_modified_at=mtime,
+            source_mtime_ns=stat.st_mtime_ns,
             source_size_bytes=stat.st_size,
             file_type=file_type,
             is_text=file_type == FileType.TEXT,
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
 
 # =============================================================================
@@ -226,9 +226,12 @@ class UnifiedFileIndex(BaseModel):
     """
 
     # Version & identification
-    version: int = Field(default=2, description='Cache format version')
+    version: int = Field(default=3, description='Cache format version')
     source_path: str = Field(..., description='Absolute path to source file')
-    source_modified_at: str = Field(..., description='Source file modification time (ISO format)')
+    source_modified_at: str = Field(..., description='Source file modification time (ISO format, for display)')
+    source_mtime_ns: int | None = Field(
+        default=None, description='Source file modification time in nanoseconds (st_mtime_ns)'
+    )
     source_size_bytes: int = Field(..., description='Source file size in bytes')
     created_at: str = Field(default_factory=lambda: datetime.now().isoformat(), description='Index creation time')
     build_time_seconds: float = Field(default=0.0, description='Time to build index in seconds')
@@ -314,8 +317,12 @@ class UnifiedFileIndex(BaseModel):
 
         try:
             stat = os.stat(source_path)
-            current_mtime = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            return self.source_modified_at == current_mtime and self.source_size_bytes == stat.st_size
+            if self.source_size_bytes != stat.st_size:
+                return False
+            # Integer mtime compare when available; ISO string for old caches
+            if self.source_mtime_ns is not None:
+                return self.source_mtime_ns == stat.st_mtime_ns
+            return self.source_modified_at == datetime.fromtimestamp(stat.st_mtime).isoformat()
         except OSError:
             return False
 
@@ -590,12 +597,13 @@ class HealthResponse(BaseModel):
 
 
 class RequestInfo(BaseModel):
-    """Information about a trace request for monitoring and tracking."""
+    """Information about a trace request for monitoring and tracking.
 
-    model_config = ConfigDict(
-        # Allow attribute assignment after creation (needed for increment_hook_counter)
-        validate_assignment=True
-    )
+    Instances are mutated in place on the hot path (increment_hook_counter
+    runs per hook call), so assignment validation is deliberately left off:
+    the counters are only ever set internally to ints, and re-validating the
+    whole model on every += would dominate the cost of the increment.
+    """
 
     request_id: str = Field(..., description='Unique identifier for the trace request')
     paths: list[str] = Field(..., description='Paths that were searched')
@@ -614,6 +622,24 @@ class RequestInfo(BaseModel):
     hook_on_complete_success: int = Field(default=0, description='Successful on_complete hook calls')
     hook_on_complete_failed: int = Field(default=0, description='Failed on_complete hook calls')
 
+    # Cached model_dump(mode='json') result. list_requests serializes the
+    # same (mostly idle) records on every poll; rebuilding the nested hooks
+    # dict and re-formatting both datetimes each time is wasted allocation.
+    # The request store resets this to None whenever it mutates the record.
+    _dump_cache: dict | None = PrivateAttr(default=None)
+
+    def model_dump(self, *args, **kwargs) -> dict:
+        """model_dump with a cache for the common mode='json' call.
+
+        The cached dict is shared between callers and must be treated as
+        read-only.
+        """
+        if not args and kwargs == {'mode': 'json'}:
+            if self._dump_cache is None:
+                self._dump_cache = super().model_dump(mode='json')
+            return self._dump_cache
+        return super().model_dump(*args, **kwargs)
+
     @computed_field
     @property
     def hooks(self) -> dict:
@@ -12,12 +12,154 @@ Security Features:
 - Supports multiple search roots for flexible configuration
 """
 
+import functools
+import os
+import stat as stat_module
 from pathlib import Path
 from typing import Optional
 
 # Global search roots - set during server startup
 _search_roots: list[Path] = []
 
+# Cached immutable (root, prefix) pairs for the resolved roots, where prefix
+# is the os.fspath() form with a trailing separator for startswith() matching.
+# Roots are constant between set_search_root*() calls, so this is computed
+# once at registration instead of on every validation. Keyed by the identity
+# of the _search_roots list so direct reassignment (e.g. in tests) stays
+# consistent.
+_roots_info_cache: Optional[tuple[list[Path], tuple[tuple[Path, str], ...]]] = None
+
+
+def _root_prefix(root: Path) -> str:
+    """Return the root's string form with a trailing separator."""
+    root_str = os.fspath(root)
+    return root_str if root_str.endswith(os.sep) else root_str + os.sep
+
+
+def _get_roots_info() -> tuple[tuple[Path, str], ...]:
+    """Return cached (root, prefix) pairs for the current search roots."""
+    global _roots_info_cache
+    roots = _search_roots
+    if _roots_info_cache is None or _roots_info_cache[0] is not roots:
+        _roots_info_cache = (roots, tuple((r, _root_prefix(r)) for r in roots))
+    return _roots_info_cache[1]
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_symlink(path_str: str) -> bool:
+    """Check (with caching) whether a path is a symlink via a single lstat.
+
+    Bounded like _resolve_within so a long-running server cannot grow the
+    cache without limit; cleared whenever the search roots change.
+    """
+    try:
+        return stat_module.S_ISLNK(os.lstat(path_str).st_mode)
+    except OSError:
+        # Nonexistent paths can't redirect anywhere
+        return False
+
+
+@functools.lru_cache(maxsize=8192)
+def _canonical_parent(parent_key: str) -> Path:
+    """Canonicalize a parent directory, memoized by its unresolved fspath.
+
+    Bounded like _resolve_within; cleared whenever the search roots change.
+    """
+    return _canonicalize(Path(parent_key))
+
+
+def _canonicalize(path: Path) -> Path:
+    """
+    Resolve a path with per-directory memoization.
+
+    Path.resolve() re-canonicalizes the full ancestor chain on every call,
+    redoing /a, /a/b, /a/b/c for each sibling under the same directory.
+    Canonicalizing the parent once (cached) and then handling only the leaf
+    component makes sibling validations O(1) syscalls amortized: a single
+    lstat on the leaf to detect a symlink.
+
+    Paths whose leaf is '.' or '..' fall back to a full resolve() so that
+    traversal semantics stay identical to Path.resolve().
+    """
+    name = path.name
+    if not name or name in ('.', '..'):
+        return path.resolve()
+
+    resolved_parent = _canonical_parent(os.fspath(path.parent))
+
+    leaf = resolved_parent / name
+    try:
+        if stat_module.S_ISLNK(os.lstat(leaf).st_mode):
+            # Leaf is a symlink - chase it (and any links in its target)
+            return leaf.resolve()
+    except OSError:
+        # Leaf doesn't exist; resolve() would keep it as-is too
+        pass
+    return leaf
+
+
+@functools.lru_cache(maxsize=8192)
+def _resolve_within(check_path_str: str, root_prefix: str) -> Optional[Path]:
+    """
+    Resolve a candidate path and check containment against one root.
+
+    Path.resolve() chases symlinks with lstat/readlink syscalls for every
+    component, and a search workload validates the same paths (and parent
+    directories) over and over. Memoizing the (path, root) pair collapses
+    those repeated syscall chains. The cache is invalidated whenever the
+    search roots change (see set_search_root/set_search_roots).
+
+    Returns:
+        The resolved Path if it is within the root, None otherwise.
+    """
+    root_len = len(root_prefix.rstrip(os.sep))
+
+    # Fast path: most filesystem components are not symlinks, so plain
+    # lexical normalization usually gives the same answer as resolve()
+    # without any readlink syscalls. Accept it only if the normalized path
+    # sits inside the root and no component below the (already canonical)
+    # root is a symlink; otherwise fall back to full canonicalization.
+    fast_str = os.path.normpath(check_path_str)
+    if fast_str.startswith(root_prefix) or len(fast_str) == root_len and root_prefix.startswith(fast_str):
+        probe = fast_str
+        has_symlink = False
+        while len(probe) > root_len:
+            if _is_symlink(probe):
+                has_symlink = True
+                break
+            parent = os.path.dirname(probe)
+            if parent == probe:
+                # dirname('/') == '/': root-level probe, nothing above it
+                break
+            probe = parent
+        if not has_symlink:
+            return Path(fast_str)
+
+    resolved = _canonicalize(Path(check_path_str))
+    resolved_str = os.fspath(resolved)
+    if resolved_str.startswith(root_prefix) or len(resolved_str) == root_len and root_prefix.startswith(resolved_str):
+        return resolved
+    return None
+
+
+def _check_root_is_dir(resolved: Path) -> None:
+    """
+    Verify a prospective search root exists and is a directory.
+
+    Uses a single os.stat instead of exists() + is_dir(), which each issue
+    their own stat syscall.
+
+    Raises:
+        ValueError: If the path doesn't exist or is not a directory.
+    """
+    try:
+        st = os.stat(resolved)
+    except OSError:
+        raise ValueError(f"Search root does not exist: {resolved}")
+
+    if not stat_module.S_ISDIR(st.st_mode):
+        raise ValueError(f"Search root is not a directory: {resolved}")
+
 
 def set_search_root(path: Optional[str | Path]) -> Path:
     """
@@ -40,14 +182,14 @@ def set_search_root(path: Optional[str | Path]) -> Path:
     else:
         resolved = Path(path).resolve()
 
-    if not resolved.exists():
-        raise ValueError(f"Search root does not exist: {resolved}")
-
-    if not resolved.is_dir():
-        raise ValueError(f"Search root is not a directory: {resolved}")
+    _check_root_is_dir(resolved)
 
     global _search_roots
     _search_roots = [resolved]
+    _get_roots_info()  # Prime the roots cache while we hold the fresh list
+    _resolve_within.cache_clear()
+    _canonical_parent.cache_clear()
+    _is_symlink.cache_clear()
     return resolved
 
 
@@ -69,23 +211,27 @@ def set_search_roots(paths: list[str | Path]) -> list[Path]:
     if not paths:
         resolved = Path.cwd().resolve()
         _search_roots = [resolved]
+        _get_roots_info()
+        _resolve_within.cache_clear()
+        _canonical_parent.cache_clear()
+        _is_symlink.cache_clear()
         return [resolved]
 
     resolved_roots = []
     for path in paths:
         resolved = Path(path).resolve()
 
-        if not resolved.exists():
-            raise ValueError(f"Search root does not exist: {resolved}")
-
-        if not resolved.is_dir():
-            raise ValueError(f"Search root is not a directory: {resolved}")
+        _check_root_is_dir(resolved)
 
         # Avoid duplicates
         if resolved not in resolved_roots:
             resolved_roots.append(resolved)
 
     _search_roots = resolved_roots
+    _get_roots_info()
+    _resolve_within.cache_clear()
+    _canonical_parent.cache_clear()
+    _is_symlink.cache_clear()
     return resolved_roots
 
 
@@ -129,11 +275,13 @@ def validate_path_within_root(path: str | Path, search_root: Optional[Path] = No
         ValueError: If no search root is configured.
         PermissionError: If the path is outside all search roots.
     """
-    # Determine which roots to check
+    # Determine which roots to check. Global roots were already resolved at
+    # registration time, so only an explicit override needs resolve() here.
     if search_root is not None:
-        roots = [search_root.resolve()]
+        resolved_root = search_root.resolve()
+        roots_info = ((resolved_root, _root_prefix(resolved_root)),)
     elif _search_roots:
-        roots = _search_roots
+        roots_info = _get_roots_info()
     else:
         raise ValueError("Search root not configured")
 
@@ -141,40 +289,22 @@ def validate_path_within_root(path: str | Path, search_root: Optional[Path] = No
     target = Path(path)
 
     # Try to validate against each root
-    resolved_path = None
-    last_error = None
-
-    for root in roots:
-        root = root.resolve()
-
+    for root, prefix in roots_info:
         # If path is relative, resolve relative to this root
         if not target.is_absolute():
             check_path = root / target
         else:
             check_path = target
 
-        # Resolve the path - this follows symlinks and normalizes ../ etc.
-        resolved = check_path.resolve()
-
-        # Check if resolved path is within this search root
-        try:
-            resolved.relative_to(root)
-            # Path is valid for this root
-            resolved_path = resolved
-            break
-        except ValueError:
-            # Path is not relative to this root, try next
-            last_error = PermissionError(
-                f"Access denied: path '{path}' resolves to '{resolved}' which is outside search roots"
-            )
-            continue
-
-    if resolved_path is None:
-        # Path wasn't valid for any root
-        roots_str = ", ".join(f"'{r}'" for r in roots)
-        raise PermissionError(f"Access denied: path '{path}' is outside all search roots: {roots_str}")
+        # Resolve the path (follows symlinks, normalizes ../ etc.) and check
+        # containment, memoized per (path, root) pair
+        resolved = _resolve_within(os.fspath(check_path), prefix)
+        if resolved is not None:
+            return resolved
 
-    return resolved_path
+    # Path wasn't valid for any root
+    roots_str = ", ".join(f"'{r}'" for r, _ in roots_info)
+    raise PermissionError(f"Access denied: path '{path}' is outside all search roots: {roots_str}")
 
 
 def validate_path_within_roots(path: str | Path, search_roots: Optional[list[Path]] = None) -> Path:
@@ -192,49 +322,39 @@ def validate_path_within_roots(path: str | Path, search_roots: Optional[list[Pat
         ValueError: If no search roots are configured.
         PermissionError: If the path is outside all search roots.
     """
-    # Determine which roots to check
+    # Determine which roots to check. Global roots were already resolved at
+    # registration time, so only explicit overrides need resolve() here.
     if search_roots is not None:
-        roots = [r.resolve() for r in search_roots]
+        resolved_roots = [r.resolve() for r in search_roots]
+        roots_info = tuple((r, _root_prefix(r)) for r in resolved_roots)
     elif _search_roots:
-        roots = _search_roots
+        roots_info = _get_roots_info()
     else:
         raise ValueError("Search roots not configured")
 
-    if not roots:
+    if not roots_info:
         raise ValueError("Search roots not configured")
 
     # Convert to Path
     target = Path(path)
 
     # Try to validate against each root
-    resolved_path = None
-
-    for root in roots:
+    for root, prefix in roots_info:
         # If path is relative, resolve relative to this root
         if not target.is_absolute():
             check_path = root / target
         else:
             check_path = target
 
-        # Resolve the path - this follows symlinks and normalizes ../ etc.
-        resolved = check_path.resolve()
-
-        # Check if resolved path is within this search root
-        try:
-            resolved.relative_to(root)
-            # Path is valid for this root
-            resolved_path = resolved
-            break
-        except ValueError:
-            # Path is not relative to this root, try next
-            continue
+        # Resolve the path (follows symlinks, normalizes ../ etc.) and check
+        # containment, memoized per (path, root) pair
+        resolved = _resolve_within(os.fspath(check_path), prefix)
+        if resolved is not None:
+            return resolved
 
-    if resolved_path is None:
-        # Path wasn't valid for any root
-        roots_str = ", ".join(f"'{r}'" for r in roots)
-        raise PermissionError(f"Access denied: path '{path}' is outside all search roots: {roots_str}")
-
-    return resolved_path
+    # Path wasn't valid for any root
+    roots_str = ", ".join(f"'{r}'" for r, _ in roots_info)
+    raise PermissionError(f"Access denied: path '{path}' is outside all search roots: {roots_str}")
 
 
 def validate_paths_within_root(paths: list[str | Path], search_root: Optional[Path] = None) -> list[Path]:
@@ -252,7 +372,18 @@ def validate_paths_within_root(paths: list[str | Path], search_root: Optional[Pa
         ValueError: If no search root is configured.
         PermissionError: If any path is outside the search root(s).
     """
-    return [validate_path_within_root(p, search_root) for p in paths]
+    if not paths:
+        return []
+
+    if search_root is not None:
+        resolved_root = search_root.resolve()
+        roots_info = ((resolved_root, _root_prefix(resolved_root)),)
+    elif _search_roots:
+        roots_info = _get_roots_info()
+    else:
+        raise ValueError("Search root not configured")
+
+    return _validate_batch(paths, roots_info)
 
 
 def validate_paths_within_roots(paths: list[str | Path], search_roots: Optional[list[Path]] = None) -> list[Path]:
@@ -270,7 +401,53 @@ def validate_paths_within_roots(paths: list[str | Path], search_roots: Optional[
         ValueError: If no search roots are configured.
         PermissionError: If any path is outside all search roots.
     """
-    return [validate_path_within_roots(p, search_roots) for p in paths]
+    if not paths:
+        return []
+
+    if search_roots is not None:
+        resolved_roots = [r.resolve() for r in search_roots]
+        roots_info = tuple((r, _root_prefix(r)) for r in resolved_roots)
+    elif _search_roots:
+        roots_info = _get_roots_info()
+    else:
+        raise ValueError("Search roots not configured")
+
+    if not roots_info:
+        raise ValueError("Search roots not configured")
+
+    return _validate_batch(paths, roots_info)
+
+
+def _validate_batch(paths: list[str | Path], roots_info: tuple[tuple[Path, str], ...]) -> list[Path]:
+    """
+    Validate a batch of paths against pre-resolved roots.
+
+    The roots are resolved exactly once by the caller, and the paths are
+    processed in sorted order so sibling files land adjacently and hit the
+    parent-directory caches while they are warm. Results are returned in
+    the original input order.
+    """
+    order = sorted(range(len(paths)), key=lambda i: os.fspath(paths[i]))
+    results: list[Path] = [None] * len(paths)  # type: ignore[list-item]
+
+    for i in order:
+        target = Path(paths[i])
+        resolved = None
+        for root, prefix in roots_info:
+            if not target.is_absolute():
+                check_path = root / target
+            else:
+                check_path = target
+            resolved = _resolve_within(os.fspath(check_path), prefix)
+            if resolved is not None:
+                break
+
+        if resolved is None:
+            roots_str = ", ".join(f"'{r}'" for r, _ in roots_info)
+            raise PermissionError(f"Access denied: path '{paths[i]}' is outside all search roots: {roots_str}")
+        results[i] = resolved
+
+    return results
 
 
 def is_path_within_root(path: str | Path, search_root: Optional[Path] = None) -> bool:
@@ -32,6 +32,8 @@ Vulnerability Pattern Taxonomy:
 
 from __future__ import annotations
 
+import copy
+import functools
 import sre_parse
 from dataclasses import dataclass, field
 from enum import Enum
@@ -832,29 +834,35 @@ class VulnerabilityDetector:
         return f"({len(branches)} branches)"
 
 
-def calculate_star_height(ast: sre_parse.SubPattern) -> int:
+def _collect_quantifier_metrics(ast: sre_parse.SubPattern) -> tuple[int, int]:
     """
-    Calculate the star height (quantifier nesting depth) of a regex.
+    Compute star height and quantifier count in a single AST traversal.
 
-    Star height is the maximum depth of nested quantifiers:
-    - a+ has star height 1
-    - (a+)+ has star height 2
-    - ((a+)+)+ has star height 3
-
-    Higher star height correlates with potential for exponential behavior.
+    Both metrics walk the exact same nodes, so calculating them separately
+    doubles the traversal work for no benefit. Returns a tuple of
+    (star_height, quantifier_count).
     """
     max_height = 0
+    count = 0
+
+    # Bind the op constants once; the traversal visits every node and a
+    # LOAD_GLOBAL + attribute lookup per comparison adds up on big patterns
+    repeat_ops = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+    subpattern_op = sre_parse.SUBPATTERN
+    branch_op = sre_parse.BRANCH
+    assert_ops = (sre_parse.ASSERT, sre_parse.ASSERT_NOT)
 
     def check_node(node: tuple, current_height: int) -> None:
-        nonlocal max_height
+        nonlocal max_height, count
         if not node or not isinstance(node, tuple):
             return
 
         op = node[0]
         value = node[1] if len(node) > 1 else None
 
-        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        if op in repeat_ops:
             min_count, max_count, items = value
+            count += 1
             is_repeating = max_count is None or max_count > 1
 
             if is_repeating:
@@ -866,55 +874,42 @@ def calculate_star_height(ast: sre_parse.SubPattern) -> int:
                 for item in items:
                     check_node(item, current_height)
 
-        elif op == sre_parse.SUBPATTERN:
+        elif op is subpattern_op:
             for item in value[3]:
                 check_node(item, current_height)
 
-        elif op == sre_parse.BRANCH:
+        elif op is branch_op:
             for branch in value[1]:
                 for item in branch:
                     check_node(item, current_height)
 
-        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        elif op in assert_ops:
             for item in value[1]:
                 check_node(item, current_height)
 
     for node in ast:
         check_node(node, 0)
 
-    return max_height
+    return max_height, count
 
 
-def count_quantifiers(ast: sre_parse.SubPattern) -> int:
-    """Count total number of quantifiers in the pattern."""
-    count = 0
-
-    def check_node(node: tuple) -> None:
-        nonlocal count
-        if not node or not isinstance(node, tuple):
-            return
-
-        op = node[0]
-        value = node[1] if len(node) > 1 else None
-
-        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
-            count += 1
-            for item in value[2]:
-                check_node(item)
+def calculate_star_height(ast: sre_parse.SubPattern) -> int:
+    """
+    Calculate the star height (quantifier nesting depth) of a regex.
 
-        elif op == sre_parse.SUBPATTERN:
-            for item in value[3]:
-                check_node(item)
+    Star height is the maximum depth of nested quantifiers:
+    - a+ has star height 1
+    - (a+)+ has star height 2
+    - ((a+)+)+ has star height 3
 
-        elif op == sre_parse.BRANCH:
-            for branch in value[1]:
-                for item in branch:
-                    check_node(item)
+    Higher star height correlates with potential for exponential behavior.
+    """
+    return _collect_quantifier_metrics(ast)[0]
 
-    for node in ast:
-        check_node(node)
 
-    return count
+def count_quantifiers(ast: sre_parse.SubPattern) -> int:
+    """Count total number of quantifiers in the pattern."""
+    return _collect_quantifier_metrics(ast)[1]
 
 
 def has_anchors(ast: sre_parse.SubPattern) -> tuple[bool, bool]:
@@ -936,6 +931,93 @@ def has_anchors(ast: sre_parse.SubPattern) -> tuple[bool, bool]:
     return has_start, has_end
 
 
+# Characters that give a pattern regex semantics. A pattern without any of
+# these is a plain substring search and needs no AST analysis at all.
+_REGEX_META_CHARS = frozenset('\\()[]{}|+*?.^$')
+
+
+def _literal_pattern_result(regex: str) -> dict:
+    """Build the analysis result for a pure literal (meta-character-free) pattern.
+
+    Matches exactly what the full AST path produces for a literal, but skips
+    sre_parse and all detector traversals.
+    """
+    return {
+        'score': 10,
+        'risk_level': 'safe',
+        'complexity_class': 'linear',
+        'complexity_notation': 'O(n)',
+        'issues': [],
+        'recommendations': ["Pattern looks safe for production use"],
+        'performance': {
+            'ops_at_100': 100,
+            'ops_at_1000': 1000,
+            'ops_at_10000': 10000,
+            'safe_for_large_files': True,
+        },
+        'star_height': 0,
+        'pattern_length': len(regex),
+        'has_anchors': (False, False),
+        # Legacy fields for compatibility
+        'level': 'very_simple',
+        'risk': 'Safe - linear complexity, suitable for large files',
+        'warnings': [],
+        'details': {
+            'star_height': 0,
+            'quantifier_count': 0,
+            'has_start_anchor': False,
+            'has_end_anchor': False,
+            'issue_count': 0,
+        },
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_regex_complexity(regex: str) -> dict:
+    """
+    Cached core of calculate_regex_complexity.
+
+    The analysis is pure with respect to the pattern string and the same
+    patterns recur across requests, so results are memoized. Callers must
+    not mutate the returned dict; the public wrapper hands out copies.
+    """
+    # Handle invalid regex
+    try:
+        ast = sre_parse.parse(regex)
+    except Exception as e:
+        return {
+            'score': 0,
+            'risk_level': 'error',
+            'complexity_class': 'unknown',
+            'complexity_notation': 'N/A',
+            'issues': [
+                {
+                    'type': 'parse_error',
+                    'severity': 'error',
+                    'explanation': f"Invalid regex pattern: {e}",
+                    'fix_suggestions': ["Check regex syntax"],
+                }
+            ],
+            'recommendations': [f"Fix syntax error: {e}"],
+            'performance': {
+                'ops_at_100': 0,
+                'ops_at_1000': 0,
+                'ops_at_10000': 0,
+                'safe_for_large_files': False,
+            },
+            'star_height': 0,
+            'pattern_length': len(regex),
+            'has_anchors': (False, False),
+            # Legacy fields
+            'level': 'error',
+            'risk': f'Invalid pattern: {e}',
+            'warnings': [f'Parse error: {e}'],
+            'details': {},
+        }
+
+    return _build_complexity_result(regex, ast)
+
+
 def calculate_regex_complexity(regex: str) -> dict:
     """
     Analyze a regex pattern for complexity and ReDoS vulnerabilities.
@@ -991,47 +1073,24 @@ def calculate_regex_complexity(regex: str) -> dict:
         - https://www.regular-expressions.info/catastrophic.html
         - https://swtch.com/~rsc/regexp/regexp1.html
     """
-    # Handle invalid regex
-    try:
-        ast = sre_parse.parse(regex)
-    except Exception as e:
-        return {
-            'score': 0,
-            'risk_level': 'error',
-            'complexity_class': 'unknown',
-            'complexity_notation': 'N/A',
-            'issues': [
-                {
-                    'type': 'parse_error',
-                    'severity': 'error',
-                    'explanation': f"Invalid regex pattern: {e}",
-                    'fix_suggestions': ["Check regex syntax"],
-                }
-            ],
-            'recommendations': [f"Fix syntax error: {e}"],
-            'performance': {
-                'ops_at_100': 0,
-                'ops_at_1000': 0,
-                'ops_at_10000': 0,
-                'safe_for_large_files': False,
-            },
-            'star_height': 0,
-            'pattern_length': len(regex),
-            'has_anchors': (False, False),
-            # Legacy fields
-            'level': 'error',
-            'risk': f'Invalid pattern: {e}',
-            'warnings': [f'Parse error: {e}'],
-            'details': {},
-        }
+    # Shortcut: most real-world search patterns are short literals. Without
+    # any metacharacter the answer is fully determined, so skip parsing and
+    # detection entirely.
+    if not _REGEX_META_CHARS.intersection(regex):
+        return _literal_pattern_result(regex)
+
+    # Cached analysis; copy so callers can't corrupt the memoized result
+    return copy.deepcopy(_analyze_regex_complexity(regex))
+
 
+def _build_complexity_result(regex: str, ast: sre_parse.SubPattern) -> dict:
+    """Run the detectors and assemble the full analysis dict for a parsed pattern."""
     # Run vulnerability detection
     detector = VulnerabilityDetector()
     issues = detector.detect_all(ast, regex)
 
-    # Calculate metrics
-    star_height = calculate_star_height(ast)
-    quantifier_count = count_quantifiers(ast)
+    # Calculate metrics (star height and quantifier count share one traversal)
+    star_height, quantifier_count = _collect_quantifier_metrics(ast)
     anchors = has_anchors(ast)
 
     # Determine overall complexity class and score
@@ -7,19 +7,49 @@ Note: This is an in-memory store. Data is lost when the process restarts.
 For persistent storage, a database backend would be needed.
 """
 
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from threading import Lock
 from typing import Optional
 
 from rx.models import RequestInfo
 
-# Thread-safe request store
+# Thread-safe request store. Mutations take _lock; single-key reads rely on
+# CPython dict operations being atomic under the GIL and skip it.
 _requests: dict[str, RequestInfo] = {}
 _lock = Lock()
 
+# (completed_at epoch seconds, request ID) pairs in completion order, so
+# eviction of the oldest completed requests is O(k) pops instead of a full
+# scan and sort of the store, and age checks are float comparisons instead
+# of per-item datetime arithmetic. May contain IDs already evicted from
+# _requests; those are skipped.
+_completed_order: deque[tuple[float, str]] = deque()
+
+# Running count of completed requests still in the store, maintained on
+# every completion transition and eviction so get_store_stats is O(1)
+# instead of scanning up to MAX_STORED_REQUESTS entries.
+_completed_count = 0
+
 # Maximum number of requests to keep in memory (to prevent memory leaks)
 MAX_STORED_REQUESTS = 100000
 
+# Field names update_request may set, resolved once at import so the update
+# path is a set-membership test per key instead of a hasattr() dispatch
+_VALID_FIELDS = frozenset(RequestInfo.model_fields)
+
+# (event_type, success) -> RequestInfo counter attribute, precomputed so the
+# per-hook-call hot path is a single dict lookup instead of an if/elif chain
+_HOOK_COUNTER_ATTRS = {
+    ('on_file', True): 'hook_on_file_success',
+    ('on_file', False): 'hook_on_file_failed',
+    ('on_match', True): 'hook_on_match_success',
+    ('on_match', False): 'hook_on_match_failed',
+    ('on_complete', True): 'hook_on_complete_success',
+    ('on_complete', False): 'hook_on_complete_failed',
+}
+
 
 def store_request(info: RequestInfo) -> None:
     """
@@ -28,11 +58,15 @@ def store_request(info: RequestInfo) -> None:
     Args:
         info: RequestInfo object to store
     """
+    global _completed_count
     with _lock:
         # If we're at capacity, remove oldest completed requests
         if len(_requests) >= MAX_STORED_REQUESTS:
             _cleanup_oldest_completed()
         _requests[info.request_id] = info
+        if info.completed_at is not None:
+            _completed_order.append((info.completed_at.timestamp(), info.request_id))
+            _completed_count += 1
 
 
 def get_request(request_id: str) -> Optional[RequestInfo]:
@@ -45,8 +79,9 @@ def get_request(request_id: str) -> Optional[RequestInfo]:
     Returns:
         RequestInfo if found, None otherwise
     """
-    with _lock:
-        return _requests.get(request_id)
+    # Lock-free: a single dict.get() is atomic under the GIL, and the store
+    # is read-mostly, so readers shouldn't serialize behind writers
+    return _requests.get(request_id)
 
 
 def update_request(request_id: str, **kwargs) -> bool:
@@ -60,13 +95,23 @@ def update_request(request_id: str, **kwargs) -> bool:
     Returns:
         True if request was found and updated, False otherwise
     """
+    global _completed_count
     with _lock:
-        if request_id in _requests:
-            for key, value in kwargs.items():
-                if hasattr(_requests[request_id], key):
-                    setattr(_requests[request_id], key, value)
-            return True
-        return False
+        info = _requests.get(request_id)
+        if info is None:
+            return False
+
+        was_completed = info.completed_at is not None
+        for key, value in kwargs.items():
+            if key in _VALID_FIELDS:
+                setattr(info, key, value)
+        info._dump_cache = None
+
+        # Track the completion transition for O(k) eviction and O(1) stats
+        if not was_completed and info.completed_at is not None:
+            _completed_order.append((info.completed_at.timestamp(), request_id))
+            _completed_count += 1
+        return True
 
 
 def increment_hook_counter(request_id: str, event_type: str, success: bool) -> None:
@@ -78,26 +123,16 @@ def increment_hook_counter(request_id: str, event_type: str, success: bool) -> N
         event_type: 'on_file', 'on_match', or 'on_complete'
         success: Whether the hook call succeeded
     """
+    attr = _HOOK_COUNTER_ATTRS.get((event_type, success))
+    if attr is None:
+        return
+
     with _lock:
-        if request_id not in _requests:
+        info = _requests.get(request_id)
+        if info is None:
             return
-
-        info = _requests[request_id]
-        if event_type == 'on_file':
-            if success:
-                info.hook_on_file_success += 1
-            else:
-                info.hook_on_file_failed += 1
-        elif event_type == 'on_match':
-            if success:
-                info.hook_on_match_success += 1
-            else:
-                info.hook_on_match_failed += 1
-        elif event_type == 'on_complete':
-            if success:
-                info.hook_on_complete_success += 1
-            else:
-                info.hook_on_complete_failed += 1
+        info._dump_cache = None
+        setattr(info, attr, getattr(info, attr) + 1)
 
 
 def list_requests(limit: int = 100, include_completed: bool = True) -> list[dict]:
@@ -111,16 +146,19 @@ def list_requests(limit: int = 100, include_completed: bool = True) -> list[dict
     Returns:
         List of request info dictionaries
     """
+    # Requests are inserted in started_at order, so walking the dict in
+    # reverse insertion order yields most-recent-first directly. This makes
+    # the common limit=100 call O(limit) instead of copying and sorting the
+    # whole store under the lock.
     with _lock:
-        requests = list(_requests.values())
-
-    if not include_completed:
-        requests = [r for r in requests if r.completed_at is None]
+        values = reversed(_requests.values())
+        if include_completed:
+            recent = list(islice(values, limit))
+        else:
+            recent = list(islice((r for r in values if r.completed_at is None), limit))
 
-    # Sort by started_at descending (most recent first)
-    requests.sort(key=lambda r: r.started_at, reverse=True)
-
-    return [r.model_dump(mode='json') for r in requests[:limit]]
+    # Serialize outside the lock
+    return [r.model_dump(mode='json') for r in recent]
 
 
 def clear_old_requests(max_age_seconds: int = 3600) -> int:
@@ -133,20 +171,28 @@ def clear_old_requests(max_age_seconds: int = 3600) -> int:
     Returns:
         Number of requests removed
     """
+    global _completed_count
     with _lock:
-        now = datetime.now()
-        to_remove = []
-
-        for rid, info in _requests.items():
-            if info.completed_at:
-                age = (now - info.completed_at).total_seconds()
-                if age > max_age_seconds:
-                    to_remove.append(rid)
-
-        for rid in to_remove:
-            del _requests[rid]
-
-        return len(to_remove)
+        # Walk only the completed entries and compare epoch floats, instead
+        # of scanning every stored request and allocating a timedelta each.
+        # Stale entries (already evicted) are dropped along the way.
+        cutoff = datetime.now().timestamp() - max_age_seconds
+        removed = 0
+        retained = []
+
+        while _completed_order:
+            ts, rid = _completed_order.popleft()
+            if ts < cutoff:
+                # pop() is idempotent: no KeyError if the entry was already
+                # evicted through another path (check-then-delete hazard)
+                if _requests.pop(rid, None) is not None:
+                    removed += 1
+                    _completed_count -= 1
+            elif rid in _requests:
+                retained.append((ts, rid))
+
+        _completed_order.extend(retained)
+        return removed
 
 
 def _cleanup_oldest_completed() -> None:
@@ -154,15 +200,17 @@ def _cleanup_oldest_completed() -> None:
     Remove oldest completed requests to make room for new ones.
     Must be called with _lock held.
     """
-    # Get completed requests sorted by completion time
-    completed = [(rid, info) for rid, info in _requests.items() if info.completed_at is not None]
-    completed.sort(key=lambda x: x[1].completed_at)
+    global _completed_count
+    # Remove oldest 10% or at least 100 requests, popping from the
+    # completion-order deque instead of scanning and sorting the store
+    target = max(len(_completed_order) // 10, min(100, len(_completed_order)))
 
-    # Remove oldest 10% or at least 100 requests
-    to_remove = max(len(completed) // 10, min(100, len(completed)))
-
-    for rid, _ in completed[:to_remove]:
-        del _requests[rid]
+    removed = 0
+    while _completed_order and removed < target:
+        _, rid = _completed_order.popleft()
+        if _requests.pop(rid, None) is not None:
+            removed += 1
+            _completed_count -= 1
 
 
 def get_store_stats() -> dict:
@@ -172,14 +220,18 @@ def get_store_stats() -> dict:
     Returns:
         Dictionary with store statistics
     """
-    with _lock:
-        total = len(_requests)
-        completed = sum(1 for r in _requests.values() if r.completed_at is not None)
-        in_progress = total - completed
-
-        return {
-            'total_requests': total,
-            'completed_requests': completed,
-            'in_progress_requests': in_progress,
-            'max_capacity': MAX_STORED_REQUESTS,
-        }
+    # Lock-free: len() and an int read are each atomic under the GIL. The
+    # counts may be marginally stale relative to concurrent writers (clamp
+    # guards the transient where the two reads straddle an update), which
+    # is all the stats endpoint needs — and it stays O(1) regardless of
+    # store size instead of scanning every entry.
+    total = len(_requests)
+    completed = min(max(_completed_count, 0), total)
+    in_progress = total - completed
+
+    return {
+        'total_requests': total,
+        'completed_requests': completed,
+        'in_progress_requests': in_progress,
+        'max_capacity': MAX_STORED_REQUESTS,
+    }
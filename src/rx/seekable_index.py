@@ -119,11 +119,15 @@ def is_index_valid(zst_path: str | Path) -> bool:
             logger.debug(f'Index version mismatch: {index.version} != {UNIFIED_INDEX_VERSION}')
             return False
 
-        # Check file metadata
+        # Check file metadata (integer mtime compare when available;
+        # ISO string for caches written before source_mtime_ns existed)
         zst_stat = zst_path.stat()
-        zst_mtime = datetime.fromtimestamp(zst_stat.st_mtime).isoformat()
+        if index.source_mtime_ns is not None:
+            mtime_matches = index.source_mtime_ns == zst_stat.st_mtime_ns
+        else:
+            mtime_matches = index.source_modified_at == datetime.fromtimestamp(zst_stat.st_mtime).isoformat()
 
-        if index.source_modified_at != zst_mtime:
+        if not mtime_matches:
             logger.debug(f'Index invalid: mtime mismatch for {zst_path}')
             return False
 
@@ -288,6 +292,7 @@ def build_index(
         version=UNIFIED_INDEX_VERSION,
         source_path=str(zst_path.resolve()),
         source_modified_at=zst_mtime,
+        source_mtime_ns=zst_stat.st_mtime_ns,
         source_size_bytes=zst_stat.st_size,
         created_at=datetime.now().isoformat(),
         file_type=FileType.SEEKABLE_ZSTD,
@@ -11,12 +11,16 @@ The seek table allows finding the compressed offset for any decompressed positio
 enabling parallel processing and random access without full decompression.
 """
 
+import functools
 import logging
 import os
 import shutil
 import struct
 import subprocess
 import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
@@ -43,10 +47,46 @@ SEEKABLE_MAGIC = 0x184D2A5E  # Skippable frame with nibble 0xE
 # Seek table footer magic (identifies seekable format)
 SEEK_TABLE_FOOTER_MAGIC = 0x8F92EAB1
 
+# Precompiled seek-table entry layout: compressed_size (u32) +
+# decompressed_size (u32), optionally followed by a checksum (u32)
+_ENTRY_STRUCT = struct.Struct("<II")
+_ENTRY_CSUM_STRUCT = struct.Struct("<III")
 
-@dataclass
+# Precompiled footer layout: magic (u32) + num_frames (u32) + flags (u8).
+# One C-level unpack per open instead of per-field struct.unpack calls that
+# reparse the format string and allocate a tuple each.
+_FOOTER_STRUCT = struct.Struct("<IIB")
+
+# Block size for the newline-alignment scan when a frame boundary lands
+# mid-line. One syscall per megabyte of overlong line instead of per 4 KB;
+# bytes.find does the scanning in C either way.
+NEWLINE_SEARCH_BLOCK = 1 << 20  # 1 MB
+
+# Per-thread zstd decompressor context. ZstdDecompressor instances are not
+# safe for concurrent use, and allocating one per frame is wasteful, so
+# each worker thread lazily creates and reuses its own.
+_thread_ctx = threading.local()
+
+
+def _get_thread_decompressor():
+    """Return this thread's cached ZstdDecompressor, creating it on first use."""
+    import zstandard as zstd
+
+    dctx = getattr(_thread_ctx, "dctx", None)
+    if dctx is None:
+        dctx = zstd.ZstdDecompressor()
+        _thread_ctx.dctx = dctx
+    return dctx
+
+
+@dataclass(slots=True, frozen=True)
 class FrameInfo:
-    """Information about a single zstd frame."""
+    """Information about a single zstd frame.
+
+    Slotted and frozen: seek tables allocate one per frame (thousands for a
+    large file) and the parsed list is shared through the seek-table cache,
+    so instances must stay compact and immutable.
+    """
 
     index: int
     compressed_offset: int
@@ -102,13 +142,10 @@ def is_seekable_zstd(filepath: str | Path) -> bool:
     Returns:
         True if file is seekable zstd, False otherwise
     """
-    filepath = Path(filepath)
-
-    if not filepath.exists():
-        return False
-
-    # Check for .zst extension
-    if filepath.suffix.lower() != ".zst":
+    # Plain string check — no Path allocation and no syscall; a missing or
+    # too-small file is caught by the open/seek probe below, so the old
+    # exists() pre-check was a redundant stat
+    if not os.fspath(filepath).lower().endswith(".zst"):
         return False
 
     try:
@@ -122,8 +159,7 @@ def is_seekable_zstd(filepath: str | Path) -> bool:
                 return False
 
             # Check footer magic
-            magic = struct.unpack("<I", footer[0:4])[0]
-            return magic == SEEK_TABLE_FOOTER_MAGIC
+            return int.from_bytes(footer[:4], "little") == SEEK_TABLE_FOOTER_MAGIC
 
     except (OSError, IOError, struct.error):
         return False
@@ -151,38 +187,48 @@ def read_seek_table(zst_path: str | Path) -> list[FrameInfo]:
     Raises:
         ValueError: If file is not a valid seekable zstd
     """
-    zst_path = Path(zst_path)
+    zst_path = os.fspath(zst_path)
 
+    # Key the cache on (path, mtime_ns, size) so a rewritten file is
+    # re-parsed while repeated reads of an unchanged file skip the O(N)
+    # table walk and FrameInfo allocation entirely — the common case, since
+    # every decompress_* call with frames=None lands here.
+    st = os.stat(zst_path)
+    return _read_seek_table_uncached(zst_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_seek_table_uncached(zst_path: str, mtime_ns: int, size: int) -> list[FrameInfo]:
+    """Parse the seek table from disk. Cached by read_seek_table."""
     with open(zst_path, "rb") as f:
         # Read footer
         f.seek(-9, 2)
         footer = f.read(9)
 
-        magic = struct.unpack("<I", footer[0:4])[0]
+        magic, num_frames, flags = _FOOTER_STRUCT.unpack(footer)
         if magic != SEEK_TABLE_FOOTER_MAGIC:
             raise ValueError(f"Not a seekable zstd file: {zst_path}")
 
-        num_frames = struct.unpack("<I", footer[4:8])[0]
-        flags = footer[8]
-
         # Check if checksums are present (flag bit 0)
         has_checksums = bool(flags & 0x01)
-        entry_size = 12 if has_checksums else 8
+        entry_struct = _ENTRY_CSUM_STRUCT if has_checksums else _ENTRY_STRUCT
+        entry_size = entry_struct.size
 
         # Read seek table entries
         seek_table_size = num_frames * entry_size
         f.seek(-9 - seek_table_size, 2)
         seek_table_data = f.read(seek_table_size)
 
-        # Parse entries
+        # Parse all entries in one C-level pass; the old loop made two
+        # struct.unpack calls and two buffer slices per frame, which
+        # dominates open cost for files with tens of thousands of frames
         frames = []
         compressed_offset = 0
         decompressed_offset = 0
 
-        for i in range(num_frames):
-            offset = i * entry_size
-            compressed_size = struct.unpack("<I", seek_table_data[offset : offset + 4])[0]
-            decompressed_size = struct.unpack("<I", seek_table_data[offset + 4 : offset + 8])[0]
+        for i, entry in enumerate(entry_struct.iter_unpack(seek_table_data)):
+            compressed_size = entry[0]
+            decompressed_size = entry[1]
 
             frames.append(
                 FrameInfo(
@@ -254,8 +300,6 @@ def decompress_frame(
         ValueError: If frame_index is out of range
         RuntimeError: If decompression fails
     """
-    zst_path = Path(zst_path)
-
     if frames is None:
         frames = read_seek_table(zst_path)
 
@@ -264,10 +308,13 @@ def decompress_frame(
 
     frame = frames[frame_index]
 
-    # Read compressed frame data
-    with open(zst_path, "rb") as f:
-        f.seek(frame.compressed_offset)
-        compressed_data = f.read(frame.compressed_size)
+    # Read compressed frame data with a positional read: one syscall instead
+    # of seek+read, and safe to issue from concurrent threads on a shared fd
+    fd = os.open(zst_path, os.O_RDONLY)
+    try:
+        compressed_data = os.pread(fd, frame.compressed_size, frame.compressed_offset)
+    finally:
+        os.close(fd)
 
     # Decompress using zstd
     try:
@@ -302,10 +349,39 @@ def decompress_frames(
     Returns:
         Dictionary mapping frame_index to decompressed bytes
     """
-    result = {}
+    if frames is None:
+        frames = read_seek_table(zst_path)
+
+    # Frames are independently decodable, so multi-frame requests are
+    # decompressed in parallel: each worker reads its frame with pread(2) on
+    # a shared fd (no seek contention) and reuses a per-thread decompressor.
+    if len(frame_indices) <= 1:
+        return {frame_index: decompress_frame(zst_path, frame_index, frames) for frame_index in frame_indices}
+
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        # Subprocess fallback stays serial; spawning one zstd process per
+        # frame concurrently would just move the contention to fork/exec
+        return {frame_index: decompress_frame(zst_path, frame_index, frames) for frame_index in frame_indices}
+
     for frame_index in frame_indices:
-        result[frame_index] = decompress_frame(zst_path, frame_index, frames)
-    return result
+        if frame_index < 0 or frame_index >= len(frames):
+            raise ValueError(f"Frame index {frame_index} out of range (0-{len(frames) - 1})")
+
+    fd = os.open(zst_path, os.O_RDONLY)
+    try:
+
+        def _decompress_one(frame_index: int) -> tuple[int, bytes]:
+            frame = frames[frame_index]
+            compressed_data = os.pread(fd, frame.compressed_size, frame.compressed_offset)
+            return frame_index, _get_thread_decompressor().decompress(compressed_data)
+
+        max_workers = min(len(frame_indices), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ZstdFrame") as executor:
+            return dict(executor.map(_decompress_one, frame_indices))
+    finally:
+        os.close(fd)
 
 
 def decompress_range(
@@ -328,35 +404,71 @@ def decompress_range(
     Returns:
         Decompressed bytes for the requested range
     """
-    zst_path = Path(zst_path)
-
     if frames is None:
         frames = read_seek_table(zst_path)
 
     end_offset = start_offset + length
 
     # Find frames that overlap with requested range
-    needed_frames = []
-    for frame in frames:
-        if frame.decompressed_offset < end_offset and frame.decompressed_end > start_offset:
-            needed_frames.append(frame.index)
+    needed_frames = find_frames_for_range(frames, start_offset, end_offset)
 
     if not needed_frames:
         return b""
 
-    # Decompress needed frames and extract requested range
-    result = b""
-    for frame_idx in needed_frames:
-        frame = frames[frame_idx]
-        frame_data = decompress_frame(zst_path, frame_idx, frames)
-
-        # Calculate slice within this frame
-        frame_start = max(0, start_offset - frame.decompressed_offset)
-        frame_end = min(len(frame_data), end_offset - frame.decompressed_offset)
-
-        result += frame_data[frame_start:frame_end]
-
-    return result[:length]
+    try:
+        import zstandard as zstd
+    except ImportError:
+        # Subprocess fallback: decompress frame by frame as before
+        result = bytearray()
+        for frame_idx in needed_frames:
+            frame = frames[frame_idx]
+            frame_data = decompress_frame(zst_path, frame_idx, frames)
+            frame_start = max(0, start_offset - frame.decompressed_offset)
+            frame_end = min(len(frame_data), end_offset - frame.decompressed_offset)
+            result += frame_data[frame_start:frame_end]
+        del result[length:]
+        return bytes(result)
+
+    import mmap
+
+    # Map the file once and feed frame slices straight to the decompressor —
+    # no per-frame open/seek/read and no intermediate compressed-bytes copies;
+    # repeated range reads are served from the page cache. Accumulate into a
+    # bytearray: += on bytes recopies the whole buffer per frame (O(N^2) for
+    # ranges spanning many frames), while bytearray appends are amortized O(1).
+    result = bytearray()
+    dctx = zstd.ZstdDecompressor()
+    with open(zst_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Tell the kernel up front which byte span the loop will touch so
+        # readahead of later frames overlaps with decoding earlier ones,
+        # instead of each frame's first page fault stalling the decoder
+        try:
+            span_start = frames[needed_frames[0]].compressed_offset
+            span_end = frames[needed_frames[-1]].compressed_end
+            page_start = span_start - (span_start % mmap.PAGESIZE)
+            mm.madvise(mmap.MADV_WILLNEED, page_start, span_end - page_start)
+        except (AttributeError, OSError, ValueError):
+            # madvise may be unavailable or reject the range; purely a hint
+            pass
+
+        with memoryview(mm) as view:
+            for frame_idx in needed_frames:
+                frame = frames[frame_idx]
+                frame_data = dctx.decompress(view[frame.compressed_offset : frame.compressed_end])
+
+                # Calculate slice within this frame
+                frame_start = max(0, start_offset - frame.decompressed_offset)
+                frame_end = min(len(frame_data), end_offset - frame.decompressed_offset)
+
+                if frame_start == 0 and frame_end == len(frame_data):
+                    # Frame lies entirely inside the range — append it whole
+                    # (every frame except possibly the first and last)
+                    result += frame_data
+                else:
+                    result += memoryview(frame_data)[frame_start:frame_end]
+
+    del result[length:]
+    return bytes(result)
 
 
 def create_seekable_zstd(
@@ -399,9 +511,36 @@ def create_seekable_zstd(
     # Check if input is compressed and needs decompression first
     input_compression = detect_compression(input_path)
     temp_file = None
+    use_t2sz = check_t2sz_available()
 
     try:
+        if input_compression != CompressionFormat.NONE and not use_t2sz:
+            # Stream the decompressor's stdout straight into the frame
+            # compressor — no temp copy of the decompressed input hits disk
+            logger.info(f"Streaming {input_compression.value} input through decompressor...")
+            decompress_cmd = get_decompressor_command(input_compression, input_path)
+            proc = subprocess.Popen(decompress_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            try:
+                # Decompressed size is unknown for a pipe; progress callbacks
+                # receive total=0
+                _compress_stream_with_pyzstd(
+                    proc.stdout, 0, output_path, frame_size_bytes, compression_level, progress_callback, threads
+                )
+            except BaseException:
+                proc.kill()
+                proc.wait()
+                raise
+            _, stderr = proc.communicate()
+            if proc.returncode != 0:
+                # Don't leave a truncated output behind
+                if output_path.exists():
+                    os.unlink(output_path)
+                raise RuntimeError(f"Decompression failed: {stderr.decode()}")
+
+            return get_seekable_zstd_info(output_path)
+
         if input_compression != CompressionFormat.NONE:
+            # t2sz reads from a file, so materialize the decompressed input
             logger.info(f"Decompressing {input_compression.value} input first...")
             # Create temporary file for decompressed content
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".tmp")
@@ -418,10 +557,8 @@ def create_seekable_zstd(
         else:
             actual_input = input_path
 
-        input_size = actual_input.stat().st_size
-
         # Create seekable zstd using t2sz if available, otherwise use pyzstd
-        if check_t2sz_available():
+        if use_t2sz:
             _create_with_t2sz(
                 actual_input,
                 output_path,
@@ -436,6 +573,7 @@ def create_seekable_zstd(
                 frame_size_bytes,
                 compression_level,
                 progress_callback,
+                threads,
             )
 
         # Get info about created file
@@ -477,25 +615,92 @@ def _create_with_t2sz(
         raise RuntimeError(f"t2sz failed: {proc.stderr.decode()}")
 
 
+def _read_aligned_chunks(fin, frame_size_bytes: int):
+    """Yield ~frame_size_bytes chunks from fin, aligned to newline boundaries.
+
+    Frame boundaries are aligned to newlines when possible, which:
+    - Makes line counting accurate and simple
+    - Prevents split lines across frame boundaries
+    - Doesn't significantly affect compression ratio
+
+    Works on non-seekable streams (pipes): bytes read past the aligning
+    newline are carried over into the next chunk instead of seeking back.
+    """
+    carry = b""
+    while True:
+        # Read a chunk of approximately frame_size_bytes
+        chunk = fin.read(frame_size_bytes)
+        if carry:
+            chunk = carry + chunk
+            carry = b""
+        if not chunk:
+            return
+
+        # Try to align frame boundary to a newline
+        # Read until we find a newline (read in blocks to handle very long lines)
+        if not chunk.endswith(b'\n'):
+            # Keep reading until we find a newline
+            while True:
+                # Read in large blocks to find the next newline
+                extra_chunk = fin.read(min(NEWLINE_SEARCH_BLOCK, frame_size_bytes))
+                if not extra_chunk:
+                    # End of file - no more newlines
+                    break
+
+                newline_pos = extra_chunk.find(b'\n')
+                if newline_pos != -1:
+                    # Found a newline! Include bytes up to and including it,
+                    # keeping the rest for the next chunk
+                    chunk += extra_chunk[: newline_pos + 1]
+                    carry = extra_chunk[newline_pos + 1 :]
+                    break
+                else:
+                    # No newline in this chunk, include it all and continue
+                    chunk += extra_chunk
+
+        yield chunk
+
+
 def _create_with_pyzstd(
     input_path: Path,
     output_path: Path,
     frame_size_bytes: int,
     compression_level: int,
     progress_callback: Optional[Callable[[int, int], None]],
+    threads: Optional[int] = None,
+) -> None:
+    """Create seekable zstd from a regular file using the pyzstd library."""
+    input_size = input_path.stat().st_size
+    with open(input_path, "rb") as fin:
+        _compress_stream_with_pyzstd(
+            fin, input_size, output_path, frame_size_bytes, compression_level, progress_callback, threads
+        )
+
+
+def _compress_stream_with_pyzstd(
+    fin,
+    input_size: int,
+    output_path: Path,
+    frame_size_bytes: int,
+    compression_level: int,
+    progress_callback: Optional[Callable[[int, int], None]],
+    threads: Optional[int] = None,
 ) -> None:
-    """Create seekable zstd using pyzstd library.
+    """Create seekable zstd from a binary stream using the pyzstd library.
 
     This creates a seekable zstd file by:
     1. Reading input in ~frame_size_bytes chunks, aligned to line boundaries
-    2. Compressing each chunk as an independent frame
+    2. Compressing each chunk as an independent frame in parallel workers
     3. Tracking compressed/decompressed sizes
     4. Writing seek table at the end
 
-    Frame boundaries are aligned to newlines when possible, which:
-    - Makes line counting accurate and simple
-    - Prevents split lines across frame boundaries
-    - Doesn't significantly affect compression ratio
+    Chunks are read serially (newline alignment requires a sequential scan)
+    but compressed concurrently: zstd releases the GIL, so independent frames
+    scale across cores. The writer drains completed frames in submission
+    order, and the in-flight window is bounded to cap memory.
+
+    The stream only needs to support read(); pipes work. input_size may be 0
+    when unknown (progress callbacks receive it as the total either way).
     """
     try:
         import zstandard as zstd
@@ -504,47 +709,32 @@ def _create_with_pyzstd(
             "Neither t2sz nor zstandard Python package available. Install with: pip install zstandard, or install t2sz"
         )
 
-    input_size = input_path.stat().st_size
+    from collections import deque
+
     frames = []
     compressed_offset = 0
 
-    cctx = zstd.ZstdCompressor(level=compression_level)
+    max_workers = threads or os.cpu_count() or 1
+
+    # Per-worker compressor contexts; ZstdCompressor is not safe for
+    # concurrent use and allocating one per frame would defeat reuse
+    worker_ctx = threading.local()
+
+    def _compress_chunk(chunk: bytes) -> bytes:
+        cctx = getattr(worker_ctx, "cctx", None)
+        if cctx is None:
+            cctx = zstd.ZstdCompressor(level=compression_level)
+            worker_ctx.cctx = cctx
+        return cctx.compress(chunk)
 
-    with open(input_path, "rb") as fin, open(output_path, "wb") as fout:
+    with open(output_path, "wb") as fout:
         decompressed_offset = 0
         frame_index = 0
         bytes_read = 0
 
-        while True:
-            # Read a chunk of approximately frame_size_bytes
-            chunk = fin.read(frame_size_bytes)
-            if not chunk:
-                break
-
-            # Try to align frame boundary to a newline
-            # Read until we find a newline (read in chunks to handle very long lines)
-            if chunk and not chunk.endswith(b'\n'):
-                # Keep reading until we find a newline
-                while True:
-                    # Read in small chunks to find the next newline
-                    extra_chunk = fin.read(min(4096, frame_size_bytes))
-                    if not extra_chunk:
-                        # End of file - no more newlines
-                        break
-
-                    newline_pos = extra_chunk.find(b'\n')
-                    if newline_pos != -1:
-                        # Found a newline! Include bytes up to and including it
-                        chunk += extra_chunk[: newline_pos + 1]
-                        # Seek back to position after the newline
-                        fin.seek(fin.tell() - len(extra_chunk) + newline_pos + 1)
-                        break
-                    else:
-                        # No newline in this chunk, include it all and continue
-                        chunk += extra_chunk
-
-            # Compress this chunk as independent frame
-            compressed_chunk = cctx.compress(chunk)
+        def _write_completed(future, chunk_len: int) -> None:
+            nonlocal compressed_offset, decompressed_offset, frame_index, bytes_read
+            compressed_chunk = future.result()
 
             # Track frame info
             frames.append(
@@ -553,7 +743,7 @@ def _create_with_pyzstd(
                     compressed_offset=compressed_offset,
                     compressed_size=len(compressed_chunk),
                     decompressed_offset=decompressed_offset,
-                    decompressed_size=len(chunk),
+                    decompressed_size=chunk_len,
                 )
             )
 
@@ -561,13 +751,26 @@ def _create_with_pyzstd(
             fout.write(compressed_chunk)
 
             compressed_offset += len(compressed_chunk)
-            decompressed_offset += len(chunk)
+            decompressed_offset += chunk_len
             frame_index += 1
-            bytes_read += len(chunk)
+            bytes_read += chunk_len
 
             if progress_callback:
                 progress_callback(bytes_read, input_size)
 
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ZstdCompress") as executor:
+            # (future, decompressed length) in submission order; bounded to
+            # 2x workers so a slow disk or huge input can't pile up chunks
+            pending = deque()
+
+            for chunk in _read_aligned_chunks(fin, frame_size_bytes):
+                pending.append((executor.submit(_compress_chunk, chunk), len(chunk)))
+                if len(pending) >= max_workers * 2:
+                    _write_completed(*pending.popleft())
+
+            while pending:
+                _write_completed(*pending.popleft())
+
         # Write seek table
         _write_seek_table(fout, frames)
 
@@ -580,24 +783,29 @@ def _write_seek_table(fout, frames: list[FrameInfo]) -> None:
     - For each frame: compressed_size (4 bytes) + decompressed_size (4 bytes)
     - Footer: magic (4 bytes) + num_frames (4 bytes) + flags (1 byte)
     """
-    # Build seek table entries
-    seek_entries = b""
-    for frame in frames:
-        seek_entries += struct.pack("<II", frame.compressed_size, frame.decompressed_size)
-
-    # Footer
-    footer = struct.pack("<IIB", SEEK_TABLE_FOOTER_MAGIC, len(frames), 0)  # flags = 0
+    # Serialize everything into one preallocated buffer: += on bytes would
+    # recopy the accumulated table per frame (O(N^2)), and a single write
+    # issues one syscall instead of one per section
+    entry_size = _ENTRY_STRUCT.size
+    header_size = 8  # skippable frame header: magic (4 bytes) + frame_size (4 bytes)
+    seek_table_size = entry_size * len(frames) + _FOOTER_STRUCT.size
 
-    # Full seek table (entries + footer)
-    seek_table = seek_entries + footer
+    buf = bytearray(header_size + seek_table_size)
 
     # Skippable frame header
-    # Format: magic (4 bytes) + frame_size (4 bytes)
-    skippable_header = struct.pack("<II", SEEKABLE_MAGIC, len(seek_table))
+    _ENTRY_STRUCT.pack_into(buf, 0, SEEKABLE_MAGIC, seek_table_size)
+
+    # Seek table entries
+    offset = header_size
+    for frame in frames:
+        _ENTRY_STRUCT.pack_into(buf, offset, frame.compressed_size, frame.decompressed_size)
+        offset += entry_size
+
+    # Footer
+    _FOOTER_STRUCT.pack_into(buf, offset, SEEK_TABLE_FOOTER_MAGIC, len(frames), 0)  # flags = 0
 
     # Write skippable frame containing seek table
-    fout.write(skippable_header)
-    fout.write(seek_table)
+    fout.write(buf)
 
 
 def find_frame_for_offset(frames: list[FrameInfo], decompressed_offset: int) -> int:
@@ -613,7 +821,11 @@ def find_frame_for_offset(frames: list[FrameInfo], decompressed_offset: int) ->
     Raises:
         ValueError: If offset is out of range
     """
-    for frame in frames:
+    # Frames are sorted by decompressed_offset, so binary-search for the
+    # last frame starting at or before the offset instead of scanning
+    idx = bisect_right(frames, decompressed_offset, key=lambda f: f.decompressed_offset) - 1
+    if idx >= 0:
+        frame = frames[idx]
         if frame.decompressed_offset <= decompressed_offset < frame.decompressed_end:
             return frame.index
 
@@ -635,8 +847,13 @@ def find_frames_for_range(
     Returns:
         List of frame indices that overlap with the range
     """
-    result = []
-    for frame in frames:
-        if frame.decompressed_offset < end_offset and frame.decompressed_end > start_offset:
-            result.append(frame.index)
-    return result
+    # Binary-search the window of candidate frames: the first frame that may
+    # still cover start_offset through the last frame starting before
+    # end_offset. The overlap filter handles empty ranges and zero-size frames.
+    lo = max(bisect_right(frames, start_offset, key=lambda f: f.decompressed_offset) - 1, 0)
+    hi = bisect_left(frames, end_offset, key=lambda f: f.decompressed_offset)
+    return [
+        frame.index
+        for frame in frames[lo:hi]
+        if frame.decompressed_offset < end_offset and frame.decompressed_end > start_offset
+    ]
@@ -42,6 +42,10 @@ class TaskManager:
         """Initialize the task manager."""
         self._tasks: Dict[str, TaskInfo] = {}  # task_id -> TaskInfo
         self._path_locks: Dict[str, str] = {}  # normalized_path -> task_id
+        # Guards the check-then-act sequences in create_task/update_task.
+        # Pure reads and the cleanup sweep skip it: single dict operations
+        # are atomic on the event loop, so get_task doesn't need to queue
+        # behind writers or a full cleanup scan.
         self._lock = asyncio.Lock()
 
     async def create_task(self, path: str, operation: str) -> tuple[TaskInfo, bool]:
@@ -123,8 +127,8 @@ class TaskManager:
         Returns:
             TaskInfo if found, None otherwise
         """
-        async with self._lock:
-            return self._tasks.get(task_id)
+        # Lock-free: a single dict lookup with no awaits around it
+        return self._tasks.get(task_id)
 
     async def cleanup_old_tasks(self, max_age_seconds: int = 3600) -> int:
         """Remove completed/failed tasks older than max_age.
@@ -135,21 +139,24 @@ class TaskManager:
         Returns:
             Number of tasks cleaned up
         """
-        async with self._lock:
-            now = datetime.now(timezone.utc)
-            to_remove = []
+        # Scan a snapshot without holding the lock so the O(N) walk never
+        # blocks create/update; deletes are idempotent single-key pops
+        now = datetime.now(timezone.utc)
+        to_remove = []
 
-            for task_id, task in self._tasks.items():
-                if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
-                    if task.completed_at:
-                        age = (now - task.completed_at).total_seconds()
-                        if age > max_age_seconds:
-                            to_remove.append(task_id)
+        for task_id, task in list(self._tasks.items()):
+            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+                if task.completed_at:
+                    age = (now - task.completed_at).total_seconds()
+                    if age > max_age_seconds:
+                        to_remove.append(task_id)
 
-            for task_id in to_remove:
-                del self._tasks[task_id]
+        removed = 0
+        for task_id in to_remove:
+            if self._tasks.pop(task_id, None) is not None:
+                removed += 1
 
-            return len(to_remove)
+        return removed
 
     async def get_all_tasks(self) -> list[TaskInfo]:
         """Get all tasks (useful for debugging/monitoring).
@@ -157,5 +164,5 @@ class TaskManager:
         Returns:
             List of all TaskInfo objects
         """
-        async with self._lock:
-            return list(self._tasks.values())
+        # Lock-free point-in-time snapshot
+        return list(self._tasks.values())
@@ -27,7 +27,7 @@ from rx.trace_cache import (
     get_cached_matches,
     get_compressed_cache_info,
     get_trace_cache_path,
-    reconstruct_match_data,
+    reconstruct_matches_batch,
     reconstruct_seekable_zstd_matches,
     save_trace_cache,
     should_cache_compressed_file,
@@ -1235,41 +1235,43 @@ def parse_multiple_files_multipattern(
         file_id = filepath_to_id.get(filepath, 'f?')
         reconstruction_start = time.time()
 
-        for cached_match in cached_matches:
-            try:
-                match_dict, ctx_lines = reconstruct_match_data(
-                    filepath,
-                    cached_match,
-                    patterns_list,
-                    pattern_ids,
-                    file_id,
-                    rg_extra_args,
-                    context_before,
-                    context_after,
-                    use_index,
-                )
-                matches.append(match_dict)
+        # Batch reconstruction: one context fetch for all cached matches
+        # instead of one file open/seek per match
+        reconstructed = reconstruct_matches_batch(
+            filepath,
+            cached_matches,
+            patterns_list,
+            pattern_ids,
+            file_id,
+            rg_extra_args,
+            context_before,
+            context_after,
+            use_index,
+        )
 
-                # Collect context lines with file_id association
-                for ctx_line in ctx_lines:
-                    all_context_lines.append((file_id, ctx_line))
+        for cached_match, result in zip(cached_matches, reconstructed):
+            if result is None:
+                continue
+            match_dict, ctx_lines = result
+            matches.append(match_dict)
 
-                # Call on_match_found hook if configured
-                if hooks and hooks.on_match_found:
-                    try:
-                        payload: dict = MatchFoundPayload(
-                            request_id=hooks.request_id,
-                            file_path=filepath,
-                            pattern=patterns_list[cached_match.get('pattern_index', 0)],
-                            offset=cached_match.get('offset', 0),
-                            line_number=cached_match.get('line_number', 0),
-                        ).model_dump()
-                        hooks.on_match_found(payload)
-                    except Exception as e:
-                        logger.warning(f'[PARSE_JSON] on_match_found hook failed: {e}')
+            # Collect context lines with file_id association
+            for ctx_line in ctx_lines:
+                all_context_lines.append((file_id, ctx_line))
 
-            except Exception as e:
-                logger.warning(f'[PARSE_JSON] Failed to reconstruct match from cache: {e}')
+            # Call on_match_found hook if configured
+            if hooks and hooks.on_match_found:
+                try:
+                    payload: dict = MatchFoundPayload(
+                        request_id=hooks.request_id,
+                        file_path=filepath,
+                        pattern=patterns_list[cached_match.get('pattern_index', 0)],
+                        offset=cached_match.get('offset', 0),
+                        line_number=cached_match.get('line_number', 0),
+                    ).model_dump()
+                    hooks.on_match_found(payload)
+                except Exception as e:
+                    logger.warning(f'[PARSE_JSON] on_match_found hook failed: {e}')
 
         reconstruction_time = time.time() - reconstruction_start
         prom.trace_cache_reconstruction_seconds.observe(reconstruction_time)
@@ -18,14 +18,18 @@ Compressed File Support:
 - On cache hit, only frames with matches are decompressed for reconstruction
 """
 
+import functools
 import hashlib
 import json
 import logging
 import os
 import re
 import time
+from collections import OrderedDict
 from datetime import datetime
+from itertools import accumulate
 from pathlib import Path
+from threading import Lock
 
 from rx.cli import prometheus as prom
 from rx.file_utils import get_context_by_lines
@@ -39,10 +43,35 @@ from rx.utils import get_rx_cache_dir
 logger = logging.getLogger(__name__)
 
 # Constants
-TRACE_CACHE_VERSION = 2  # Bumped for compressed file support
+TRACE_CACHE_VERSION = 4  # Bumped for delta-encoded columnar match storage
 
 # Flags that affect matching and must be part of cache key
-MATCHING_FLAGS = {'-i', '-w', '-x', '-F', '-P', '--case-sensitive', '--ignore-case'}
+MATCHING_FLAGS = frozenset({'-i', '-w', '-x', '-F', '-P', '--case-sensitive', '--ignore-case'})
+
+
+# Parsed cache_data keyed by (path, mtime_ns), so repeated scans of the
+# same file skip the open + JSON decode entirely. Keyed on mtime_ns, a
+# rewritten cache file naturally misses and the stale entry ages out.
+_CACHE_LRU: OrderedDict[tuple[str, int], dict] = OrderedDict()
+_CACHE_LRU_MAX = 32
+_cache_lru_lock = Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _relevant_flags(rg_flags: tuple[str, ...]) -> tuple[str, ...]:
+    """Filter and sort the flags that affect matching, memoized per tuple."""
+    return tuple(sorted(f for f in rg_flags if f in MATCHING_FLAGS))
+
+
+@functools.lru_cache(maxsize=4096)
+def _abs(path: str) -> str:
+    """Memoized os.path.abspath.
+
+    abspath consults the cwd, so resolving the same path for every cache
+    operation in a batch scan costs a getcwd syscall per call. The process
+    does not chdir, which makes the result stable for a given input.
+    """
+    return os.path.abspath(path)
 
 
 def get_trace_cache_dir() -> Path:
@@ -58,26 +87,48 @@ def compute_patterns_hash(patterns: list[str], rg_flags: list[str]) -> str:
         rg_flags: List of ripgrep flags
 
     Returns:
-        First 16 chars of SHA256 hash
+        16-char hex digest of the patterns and flags
     """
+    # Memoized on tuples: a directory scan recomputes this hash for the
+    # same (patterns, flags) once per file per call site
+    return _compute_patterns_hash_cached(tuple(patterns), tuple(rg_flags))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern:
+    """Compile a pattern once per scan instead of once per cached match.
+
+    re.finditer with a string consults re's internal bounded cache on every
+    call; reconstruction runs the same handful of patterns over thousands
+    of matches, so a direct memo keeps this to one compile per pattern.
+    """
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_patterns_hash_cached(patterns: tuple[str, ...], rg_flags: tuple[str, ...]) -> str:
     # Sort patterns for consistent hashing
     sorted_patterns = sorted(patterns)
 
     # Extract only flags that affect matching
-    relevant_flags = sorted([f for f in rg_flags if f in MATCHING_FLAGS])
+    relevant_flags = list(_relevant_flags(rg_flags))
 
     # Combine patterns and flags into hash input
     hash_input = json.dumps({'patterns': sorted_patterns, 'flags': relevant_flags}, sort_keys=True)
 
-    return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+    # blake2b: these digests are dictionary keys, not security boundaries,
+    # and blake2 is markedly cheaper than SHA256 on short inputs
+    return hashlib.blake2b(hash_input.encode(), digest_size=8).hexdigest()
 
 
 def get_trace_cache_path(source_path: str, patterns: list[str], rg_flags: list[str]) -> Path:
     """Generate the cache file path for a source file and patterns.
 
-    Uses SHA256 hash of absolute path plus patterns hash to create a unique
-    but identifiable cache filename. Structure is:
-    <cache_dir>/<patterns_hash>/<path_hash>_<filename>.json
+    Uses a short hash of the absolute path plus patterns hash to create a
+    unique but identifiable cache filename. The first two hex chars of the
+    path hash become a git-style shard directory so no single directory
+    accumulates thousands of entries. Structure is:
+    <cache_dir>/<patterns_hash>/<shard>/<path_hash>_<filename>.json
 
     Args:
         source_path: Path to the source file
@@ -87,12 +138,12 @@ def get_trace_cache_path(source_path: str, patterns: list[str], rg_flags: list[s
     Returns:
         Path to the cache file in cache directory
     """
-    abs_path = os.path.abspath(source_path)
-    path_hash = hashlib.sha256(abs_path.encode()).hexdigest()[:16]
+    abs_path = _abs(source_path)
+    path_hash = hashlib.blake2b(abs_path.encode(), digest_size=8).hexdigest()
     patterns_hash = compute_patterns_hash(patterns, rg_flags)
     filename = os.path.basename(source_path)
-    cache_filename = f'{path_hash}_{filename}.json'
-    return get_trace_cache_dir() / patterns_hash / cache_filename
+    cache_filename = f'{path_hash[2:]}_{filename}.json'
+    return get_trace_cache_dir() / patterns_hash / path_hash[:2] / cache_filename
 
 
 def is_trace_cache_valid(source_path: str, patterns: list[str], rg_flags: list[str]) -> bool:
@@ -112,20 +163,23 @@ def is_trace_cache_valid(source_path: str, patterns: list[str], rg_flags: list[s
     Returns:
         True if valid cache exists, False otherwise
     """
-    cache_path = get_trace_cache_path(source_path, patterns, rg_flags)
-    if not cache_path.exists():
-        return False
+    return _load_valid_cache(source_path, patterns, rg_flags, expand_matches=False) is not None
 
-    try:
-        cache_data = load_trace_cache(cache_path)
-        if cache_data is None:
-            return False
 
+def _validate_cache_data(cache_data: dict, source_path: str, patterns: list[str], rg_flags: list[str]) -> bool:
+    """Check already-loaded cache data against the source file and patterns."""
+    try:
         source_stat = os.stat(source_path)
-        source_mtime = datetime.fromtimestamp(source_stat.st_mtime).isoformat()
 
-        # Validate file metadata
-        if cache_data.get('source_modified_at') != source_mtime:
+        # Validate file metadata. Current caches store the raw st_mtime_ns
+        # integer so the hot check is an int compare; older caches carried
+        # an isoformat string and take the datetime path.
+        mtime_ns = cache_data.get('source_mtime_ns')
+        if mtime_ns is not None:
+            if mtime_ns != source_stat.st_mtime_ns:
+                logger.debug(f'Cache invalid: mtime mismatch for {source_path}')
+                return False
+        elif cache_data.get('source_modified_at') != datetime.fromtimestamp(source_stat.st_mtime).isoformat():
             logger.debug(f'Cache invalid: mtime mismatch for {source_path}')
             return False
         if cache_data.get('source_size_bytes') != source_stat.st_size:
@@ -139,22 +193,70 @@ def is_trace_cache_valid(source_path: str, patterns: list[str], rg_flags: list[s
             return False
 
         return True
-    except (OSError, json.JSONDecodeError, KeyError) as e:
+    except (OSError, KeyError) as e:
         logger.debug(f'Cache validation failed for {source_path}: {e}')
         return False
 
 
-def load_trace_cache(cache_path: Path | str) -> dict | None:
+def _load_valid_cache(
+    source_path: str, patterns: list[str], rg_flags: list[str], expand_matches: bool = True
+) -> dict | None:
+    """Load and validate the cache for a source file in a single parse.
+
+    Validation needs only the header fields, but the header lives in the
+    same JSON document as the matches, so splitting validation and
+    retrieval into separate loads would parse the whole file twice.
+
+    Returns:
+        Validated cache data, or None if missing or stale
+    """
+    cache_path = get_trace_cache_path(source_path, patterns, rg_flags)
+    if not cache_path.exists():
+        return None
+
+    cache_data = load_trace_cache(cache_path, expand_matches=expand_matches)
+    if cache_data is None:
+        return None
+
+    if not _validate_cache_data(cache_data, source_path, patterns, rg_flags):
+        return None
+
+    return cache_data
+
+
+def _match_count(cache_data: dict) -> int:
+    """Number of cached matches, without forcing expansion to dicts."""
+    if 'matches' in cache_data:
+        return len(cache_data['matches'])
+    return len(cache_data.get('pattern_indices', ()))
+
+
+def load_trace_cache(cache_path: Path | str, expand_matches: bool = True) -> dict | None:
     """Load a trace cache file from disk.
 
     Args:
         cache_path: Path to the cache file
+        expand_matches: Whether to materialize the matches list of dicts.
+            Header-only consumers (validation, info) pass False so a cache
+            with millions of entries never allocates per-match dicts; the
+            parsed int arrays stay as-is until a caller needs the matches.
 
     Returns:
         Cache data dictionary, or None if loading fails
     """
     start_time = time.time()
     try:
+        key = (str(cache_path), os.stat(cache_path).st_mtime_ns)
+        with _cache_lru_lock:
+            data = _CACHE_LRU.get(key)
+            if data is not None:
+                _CACHE_LRU.move_to_end(key)
+        if data is not None:
+            if expand_matches:
+                data = _expand_matches(data)
+            prom.trace_cache_load_duration_seconds.observe(time.time() - start_time)
+            return data
+
         with open(cache_path, encoding='utf-8') as f:
             data = json.load(f)
 
@@ -164,6 +266,17 @@ def load_trace_cache(cache_path: Path | str) -> dict | None:
             prom.trace_cache_load_duration_seconds.observe(time.time() - start_time)
             return None
 
+        with _cache_lru_lock:
+            _CACHE_LRU[key] = data
+            while len(_CACHE_LRU) > _CACHE_LRU_MAX:
+                _CACHE_LRU.popitem(last=False)
+
+        if expand_matches:
+            # The LRU keeps the compact columnar form; each caller gets
+            # its own expanded dict so concurrent loads never race on a
+            # shared mutation
+            data = _expand_matches(data)
+
         prom.trace_cache_load_duration_seconds.observe(time.time() - start_time)
         return data
     except (OSError, json.JSONDecodeError) as e:
@@ -172,6 +285,70 @@ def load_trace_cache(cache_path: Path | str) -> dict | None:
         return None
 
 
+def _columnize_matches(cache_data: dict) -> dict:
+    """Convert the matches list to parallel arrays for serialization.
+
+    A row-oriented matches list repeats the same three key strings per
+    entry, so for large caches most of the JSON is key names. On disk the
+    matches are stored as parallel int arrays (pattern_indices, offsets,
+    line_numbers, and frame_indices when present), cutting encode/decode
+    work and file size several-fold. The in-memory API keeps list-of-dicts.
+    """
+    matches = cache_data.get('matches')
+    if matches is None:
+        return cache_data
+
+    payload = {key: value for key, value in cache_data.items() if key != 'matches'}
+    payload['pattern_indices'] = [m.get('pattern_index', 0) for m in matches]
+    # Offsets and line numbers grow monotonically through a scan, so
+    # storing first-order deltas keeps most values at a few digits
+    # instead of full absolute byte offsets
+    payload['offset_deltas'] = _delta_encode([m.get('offset', 0) for m in matches])
+    payload['line_number_deltas'] = _delta_encode([m.get('line_number', 0) for m in matches])
+    if any('frame_index' in m for m in matches):
+        # -1 marks matches without a frame (mixed caches)
+        payload['frame_indices'] = [m.get('frame_index', -1) for m in matches]
+    return payload
+
+
+def _delta_encode(values: list[int]) -> list[int]:
+    """First-order delta encoding; inverse of itertools.accumulate."""
+    if not values:
+        return []
+    return [values[0]] + [values[i] - values[i - 1] for i in range(1, len(values))]
+
+
+_COLUMNAR_KEYS = ('pattern_indices', 'offset_deltas', 'line_number_deltas', 'frame_indices')
+
+
+def _expand_matches(data: dict) -> dict:
+    """Build a dict with the matches list rebuilt from the parallel arrays.
+
+    Never mutates data: the columnar dict is shared through the LRU across
+    threads, so expansion returns a fresh dict and leaves the shared entry
+    untouched. Data already in row form is returned as-is.
+    """
+    if 'matches' in data or 'pattern_indices' not in data:
+        return data
+
+    expanded = {key: value for key, value in data.items() if key not in _COLUMNAR_KEYS}
+    matches = [
+        {'pattern_index': pattern_index, 'offset': offset, 'line_number': line_number}
+        for pattern_index, offset, line_number in zip(
+            data['pattern_indices'],
+            accumulate(data['offset_deltas']),
+            accumulate(data['line_number_deltas']),
+        )
+    ]
+    frame_indices = data.get('frame_indices')
+    if frame_indices:
+        for match, frame_index in zip(matches, frame_indices):
+            if frame_index >= 0:
+                match['frame_index'] = frame_index
+    expanded['matches'] = matches
+    return expanded
+
+
 def save_trace_cache(cache_data: dict, cache_path: Path | str) -> bool:
     """Save a trace cache to disk.
 
@@ -182,11 +359,19 @@ def save_trace_cache(cache_data: dict, cache_path: Path | str) -> bool:
     Returns:
         True if saved successfully, False otherwise
     """
+    cache_path = Path(cache_path)
     try:
-        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
-
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Compact output: cache files are machine-read only, and indent=2 is
+        # the slowest json.dump configuration while inflating large caches.
+        # Encode to one in-memory buffer and write it through a temp file +
+        # rename: a single write instead of one per JSON token, and readers
+        # never observe a partially written cache.
+        payload = json.dumps(_columnize_matches(cache_data), separators=(',', ':'), ensure_ascii=False)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        tmp_path.write_bytes(payload.encode('utf-8'))
+        os.replace(tmp_path, cache_path)
 
         prom.trace_cache_writes_total.inc()
         logger.info(f'Trace cache saved to {cache_path}')
@@ -209,6 +394,9 @@ def delete_trace_cache(source_path: str, patterns: list[str], rg_flags: list[str
     """
     cache_path = get_trace_cache_path(source_path, patterns, rg_flags)
     try:
+        with _cache_lru_lock:
+            for key in [k for k in _CACHE_LRU if k[0] == str(cache_path)]:
+                del _CACHE_LRU[key]
         if cache_path.exists():
             cache_path.unlink()
             logger.info(f'Deleted trace cache for {source_path}')
@@ -233,12 +421,7 @@ def get_cached_matches(
     Returns:
         List of cached match dicts, or None if no valid cache
     """
-    if not is_trace_cache_valid(source_path, patterns, rg_flags):
-        prom.trace_cache_misses_total.inc()
-        return None
-
-    cache_path = get_trace_cache_path(source_path, patterns, rg_flags)
-    cache_data = load_trace_cache(cache_path)
+    cache_data = _load_valid_cache(source_path, patterns, rg_flags)
 
     if cache_data is None:
         prom.trace_cache_misses_total.inc()
@@ -268,20 +451,26 @@ def build_cache_from_matches(
     Returns:
         Cache data dictionary ready to be saved
     """
-    abs_path = os.path.abspath(source_path)
+    abs_path = _abs(source_path)
     source_stat = os.stat(source_path)
-    source_mtime = datetime.fromtimestamp(source_stat.st_mtime).isoformat()
 
     # Convert matches to cache format
-    # We need to map pattern_id back to pattern_index
-    pattern_id_to_index = {f'p{i + 1}': i for i in range(len(patterns))}
+    num_patterns = len(patterns)
 
     cached_matches = []
     frames_with_matches: set[int] = set()
 
     for match in matches:
+        # Pattern IDs are always f'p{index + 1}', so mapping back is
+        # arithmetic rather than a lookup table; anything malformed or out
+        # of range degrades to index 0 like the old dict default did
         pattern_id = match.get('pattern', 'p1')
-        pattern_index = pattern_id_to_index.get(pattern_id, 0)
+        try:
+            pattern_index = int(pattern_id[1:]) - 1
+        except (ValueError, TypeError):
+            pattern_index = 0
+        if not 0 <= pattern_index < num_patterns:
+            pattern_index = 0
 
         cached_match = {
             'pattern_index': pattern_index,
@@ -298,17 +487,19 @@ def build_cache_from_matches(
         cached_matches.append(cached_match)
 
     # Extract relevant flags for cache key
-    relevant_flags = sorted([f for f in rg_flags if f in MATCHING_FLAGS])
+    relevant_flags = list(_relevant_flags(tuple(rg_flags)))
 
     cache_data = {
         'version': TRACE_CACHE_VERSION,
         'source_path': abs_path,
-        'source_modified_at': source_mtime,
+        'source_mtime_ns': source_stat.st_mtime_ns,
         'source_size_bytes': source_stat.st_size,
         'patterns': patterns,
         'patterns_hash': compute_patterns_hash(patterns, rg_flags),
         'rg_flags': relevant_flags,
-        'created_at': datetime.now().isoformat(),
+        # created_at is a debug aid; strftime formats the epoch in one C
+        # call without constructing a datetime
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
         'matches': cached_matches,
     }
 
@@ -353,12 +544,6 @@ def reconstruct_match_data(
         Tuple of (match_dict, context_lines)
     """
     line_number = cached_match.get('line_number', 1)
-    offset = cached_match.get('offset', 0)
-    pattern_index = cached_match.get('pattern_index', 0)
-
-    # Get pattern info
-    pattern = patterns[pattern_index] if pattern_index < len(patterns) else patterns[0]
-    pattern_id = f'p{pattern_index + 1}'
 
     # Get line content + context using existing infrastructure
     context_data = get_context_by_lines(
@@ -369,6 +554,86 @@ def reconstruct_match_data(
         use_index=use_index,
     )
 
+    return _assemble_match(cached_match, context_data, patterns, file_id, rg_flags, context_before)
+
+
+def reconstruct_matches_batch(
+    source_path: str,
+    cached_matches: list[dict],
+    patterns: list[str],
+    pattern_ids: dict[str, str],
+    file_id: str,
+    rg_flags: list[str],
+    context_before: int = 0,
+    context_after: int = 0,
+    use_index: bool = True,
+) -> list[tuple[dict, list[ContextLine]] | None]:
+    """Reconstruct all cached matches for a file with one context fetch.
+
+    Calling reconstruct_match_data per match re-opens the file (or
+    re-consults the index) once per cached match; for caches with
+    thousands of hits that is thousands of opens and seeks. This variant
+    fetches context for every line number in a single get_context_by_lines
+    call and assembles the matches from the shared result.
+
+    Args:
+        source_path: Path to the source file
+        cached_matches: List of cached match dicts
+        patterns: List of regex patterns
+        pattern_ids: Dict mapping pattern_id to pattern string
+        file_id: File ID for this file (e.g., 'f1')
+        rg_flags: List of ripgrep flags
+        context_before: Number of context lines before each match
+        context_after: Number of context lines after each match
+        use_index: Whether to use/create index for large files
+
+    Returns:
+        List aligned with cached_matches; each entry is a
+        (match_dict, context_lines) tuple, or None if that match could
+        not be reconstructed
+    """
+    line_numbers = sorted({m.get('line_number', 1) for m in cached_matches})
+
+    try:
+        context_data = get_context_by_lines(
+            source_path,
+            line_numbers,
+            context_before,
+            context_after,
+            use_index=use_index,
+        )
+    except Exception as e:
+        logger.warning(f'Failed to fetch context for cached matches in {source_path}: {e}')
+        return [None] * len(cached_matches)
+
+    results: list[tuple[dict, list[ContextLine]] | None] = []
+    for cached_match in cached_matches:
+        try:
+            results.append(_assemble_match(cached_match, context_data, patterns, file_id, rg_flags, context_before))
+        except Exception as e:
+            logger.warning(f'Failed to reconstruct match from cache: {e}')
+            results.append(None)
+
+    return results
+
+
+def _assemble_match(
+    cached_match: dict,
+    context_data: dict[int, list[str]],
+    patterns: list[str],
+    file_id: str,
+    rg_flags: list[str],
+    context_before: int,
+) -> tuple[dict, list[ContextLine]]:
+    """Build a match dict and context lines from already-fetched context."""
+    line_number = cached_match.get('line_number', 1)
+    offset = cached_match.get('offset', 0)
+    pattern_index = cached_match.get('pattern_index', 0)
+
+    # Get pattern info
+    pattern = patterns[pattern_index] if pattern_index < len(patterns) else patterns[0]
+    pattern_id = f'p{pattern_index + 1}'
+
     all_lines = context_data.get(line_number, [])
 
     # Find the matched line (middle of context window if context was requested)
@@ -383,7 +648,7 @@ def reconstruct_match_data(
     flags = re.IGNORECASE if '-i' in rg_flags else 0
     submatches = []
     try:
-        for m in re.finditer(pattern, matched_line, flags):
+        for m in _compile_pattern(pattern, flags).finditer(matched_line):
             submatches.append(
                 Submatch(
                     text=m.group(),
@@ -443,11 +708,7 @@ def get_compressed_cache_info(
         Dict with cache info including compression_format and frames_with_matches,
         or None if no valid cache exists
     """
-    if not is_trace_cache_valid(source_path, patterns, rg_flags):
-        return None
-
-    cache_path = get_trace_cache_path(source_path, patterns, rg_flags)
-    cache_data = load_trace_cache(cache_path)
+    cache_data = _load_valid_cache(source_path, patterns, rg_flags)
 
     if cache_data is None:
         return None
@@ -537,7 +798,7 @@ def reconstruct_seekable_zstd_match(
     flags = re.IGNORECASE if '-i' in rg_flags else 0
     submatches = []
     try:
-        for m in re.finditer(pattern, matched_line, flags):
+        for m in _compile_pattern(pattern, flags).finditer(matched_line):
             submatches.append(
                 Submatch(
                     text=m.group(),
@@ -757,19 +1018,27 @@ def get_trace_cache_info(source_path: str, patterns: list[str], rg_flags: list[s
     if not cache_path.exists():
         return None
 
-    cache_data = load_trace_cache(cache_path)
+    cache_data = load_trace_cache(cache_path, expand_matches=False)
     if cache_data is None:
         return None
 
+    # Human-readable mtime is derived here, on the info path only; the
+    # validation hot path compares raw nanosecond ints
+    mtime_ns = cache_data.get('source_mtime_ns')
+    if mtime_ns is not None:
+        source_modified_at = datetime.fromtimestamp(mtime_ns / 1e9).isoformat()
+    else:
+        source_modified_at = cache_data.get('source_modified_at')
+
     return {
         'cache_path': str(cache_path),
         'source_path': cache_data.get('source_path'),
         'source_size_bytes': cache_data.get('source_size_bytes'),
-        'source_modified_at': cache_data.get('source_modified_at'),
+        'source_modified_at': source_modified_at,
         'created_at': cache_data.get('created_at'),
         'patterns': cache_data.get('patterns'),
         'patterns_hash': cache_data.get('patterns_hash'),
         'rg_flags': cache_data.get('rg_flags'),
-        'match_count': len(cache_data.get('matches', [])),
-        'is_valid': is_trace_cache_valid(source_path, patterns, rg_flags),
+        'match_count': _match_count(cache_data),
+        'is_valid': _validate_cache_data(cache_data, source_path, patterns, rg_flags),
     }
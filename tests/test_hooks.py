@@ -12,6 +12,7 @@ from rx.hooks import (
     get_effective_hooks,
     get_hook_env_config,
 )
+import rx.request_store as request_store
 from rx.models import FileScannedPayload, MatchFoundPayload, TraceCompletePayload
 from rx.request_store import (
     RequestInfo,
@@ -258,6 +259,8 @@ class TestRequestStore:
         """Clear request store before each test."""
         with _lock:
             _requests.clear()
+            request_store._completed_order.clear()
+            request_store._completed_count = 0
 
     def test_store_and_get_request(self):
         """Test storing and retrieving a request."""
@@ -1,6 +1,6 @@
 """Tests for index version consistency across all index types.
 
-This module verifies that all index creation methods use the same version (UNIFIED_INDEX_VERSION = 2)
+This module verifies that all index creation methods use the same version (UNIFIED_INDEX_VERSION = 3)
 and that indexes created by different modules are compatible.
 """
 
@@ -46,9 +46,9 @@ if CAN_CREATE_SEEKABLE:
 class TestUnifiedVersionConstant:
     """Verify UNIFIED_INDEX_VERSION is set correctly."""
 
-    def test_unified_index_version_is_2(self):
-        """Test that UNIFIED_INDEX_VERSION equals 2."""
-        assert UNIFIED_INDEX_VERSION == 2, f'Expected version 2, got {UNIFIED_INDEX_VERSION}'
+    def test_unified_index_version_is_3(self):
+        """Test that UNIFIED_INDEX_VERSION equals 3."""
+        assert UNIFIED_INDEX_VERSION == 3, f'Expected version 3, got {UNIFIED_INDEX_VERSION}'
 
 
 class TestTextFileIndexVersion:
@@ -69,23 +69,23 @@ class TestTextFileIndexVersion:
         if index_path.exists():
             index_path.unlink()
 
-    def test_build_unified_index_uses_version_2(self, temp_text_file):
-        """Test that build_index from unified_index.py creates version 2."""
+    def test_build_unified_index_uses_version_3(self, temp_text_file):
+        """Test that build_index from unified_index.py creates version 3."""
         result = build_unified_index(temp_text_file)
         # The result is an IndexBuildResult, not a dict - version is used when saving
         # We need to use FileIndexer to get a proper UnifiedFileIndex
         indexer = FileIndexer(analyze=True)
         index = indexer.index_file(temp_text_file)
         assert index.version == UNIFIED_INDEX_VERSION
-        assert index.version == 2
+        assert index.version == 3
 
-    def test_file_indexer_creates_version_2(self, temp_text_file):
-        """Test that FileIndexer creates indexes with version 2."""
+    def test_file_indexer_creates_version_3(self, temp_text_file):
+        """Test that FileIndexer creates indexes with version 3."""
         indexer = FileIndexer(analyze=True)
         index = indexer.index_file(temp_text_file)
 
         assert isinstance(index, UnifiedFileIndex)
-        assert index.version == 2
+        assert index.version == 3
         assert index.version == UNIFIED_INDEX_VERSION
 
 
@@ -106,12 +106,12 @@ class TestCompressedFileIndexVersion:
 
         yield str(gzip_path)
 
-    def test_build_compressed_index_uses_version_2(self, temp_gzip_file):
-        """Test that build_compressed_index creates version 2."""
+    def test_build_compressed_index_uses_version_3(self, temp_gzip_file):
+        """Test that build_compressed_index creates version 3."""
         index_data = build_compressed_index(temp_gzip_file)
 
         assert index_data['version'] == UNIFIED_INDEX_VERSION
-        assert index_data['version'] == 2
+        assert index_data['version'] == 3
 
 
 @pytest.mark.skipif(not CAN_CREATE_SEEKABLE, reason='Neither t2sz nor zstandard available')
@@ -138,20 +138,20 @@ class TestSeekableZstdIndexVersion:
 
         yield output_file
 
-    def test_build_seekable_index_uses_version_2(self, temp_seekable_zstd_file):
-        """Test that build_index from seekable_index.py creates version 2."""
+    def test_build_seekable_index_uses_version_3(self, temp_seekable_zstd_file):
+        """Test that build_index from seekable_index.py creates version 3."""
         index = build_seekable_index(temp_seekable_zstd_file)
 
         assert index.version == UNIFIED_INDEX_VERSION
-        assert index.version == 2
+        assert index.version == 3
 
-    def test_seekable_index_model_dump_has_version_2(self, temp_seekable_zstd_file):
-        """Test that UnifiedFileIndex.model_dump() includes version 2."""
+    def test_seekable_index_model_dump_has_version_3(self, temp_seekable_zstd_file):
+        """Test that UnifiedFileIndex.model_dump() includes version 3."""
         index = build_seekable_index(temp_seekable_zstd_file)
         index_dict = index.model_dump()
 
         assert index_dict['version'] == UNIFIED_INDEX_VERSION
-        assert index_dict['version'] == 2
+        assert index_dict['version'] == 3
 
 
 class TestIndexPathConsistency:
@@ -183,8 +183,8 @@ class TestIndexPathConsistency:
         assert unified_path == seekable_path, f'Path mismatch:\n  unified: {unified_path}\n  seekable: {seekable_path}'
 
 
-class TestAllIndexTypesUseVersion2:
-    """Integration test ensuring all index creation paths use version 2."""
+class TestAllIndexTypesUseVersion3:
+    """Integration test ensuring all index creation paths use version 3."""
 
     @pytest.fixture
     def temp_files(self, tmp_path, monkeypatch):
@@ -215,8 +215,8 @@ class TestAllIndexTypesUseVersion2:
 
         yield files
 
-    def test_all_index_types_use_version_2(self, temp_files):
-        """Comprehensive test that all index types use version 2."""
+    def test_all_index_types_use_version_3(self, temp_files):
+        """Comprehensive test that all index types use version 3."""
         versions_found = {}
 
         # Test unified/text file index
@@ -235,7 +235,7 @@ class TestAllIndexTypesUseVersion2:
 
         # All versions should be 2
         for index_type, version in versions_found.items():
-            assert version == 2, f'{index_type} index has version {version}, expected 2'
+            assert version == 3, f'{index_type} index has version {version}, expected 3'
 
         # All versions should match UNIFIED_INDEX_VERSION
         for index_type, version in versions_found.items():
@@ -332,6 +332,18 @@ class TestEdgeCases:
         result = validate_path_within_root(str(file_path))
         assert result == file_path.resolve()
 
+    def test_filesystem_root_as_search_root(self):
+        """Test that '/' as the search root validates paths without hanging."""
+        file_path = self.root / "file.txt"
+        file_path.write_text("content")
+
+        set_search_root("/")
+        try:
+            result = validate_path_within_root(file_path)
+            assert result == file_path.resolve()
+        finally:
+            set_search_root(self.root)
+
     def test_deeply_nested_escape_attempt(self):
         """Test deeply nested escape attempt is blocked."""
         # Create deep directory structure
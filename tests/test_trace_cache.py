@@ -808,14 +808,14 @@ class TestCompressedFileCaching:
         assert cache_data["frames_with_matches"] == [0]
 
     def test_cache_version_updated(self, temp_text_file):
-        """Test that cache version is 2 for compressed file support."""
-        assert TRACE_CACHE_VERSION == 2
+        """Test that cache version is 4 for delta-encoded columnar storage."""
+        assert TRACE_CACHE_VERSION == 4
 
         patterns = ["ERROR"]
         matches = [{"pattern": "p1", "offset": 0, "relative_line_number": 1}]
 
         cache_data = build_cache_from_matches(temp_text_file, patterns, [], matches)
-        assert cache_data["version"] == 2
+        assert cache_data["version"] == 4
 
 
 class TestCompressedCacheHelpers:
@@ -23,6 +23,7 @@ from rx.unified_index import (
     get_index_step_bytes,
     get_large_file_threshold_bytes,
     load_index,
+    save_index,
 )
 
 
@@ -276,6 +277,82 @@ class TestSaveLoadIndex:
         # Just verify it doesn't crash
 
 
+class TestLineIndexSidecar:
+    """Tests for the binary .idx sidecar used by large line indexes."""
+
+    def _make_index(self, source_path, checkpoints=50):
+        """Build an index with a synthetic line_index for source_path."""
+        from datetime import datetime
+
+        from rx.models import FileType
+
+        stat = os.stat(source_path)
+        return UnifiedFileIndex(
+            source_path=source_path,
+            source_modified_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            source_mtime_ns=stat.st_mtime_ns,
+            source_size_bytes=stat.st_size,
+            file_type=FileType.TEXT,
+            line_index=[[i * 100 + 1, i * 4096] for i in range(checkpoints)],
+        )
+
+    @pytest.fixture
+    def low_threshold(self, tmp_path, monkeypatch):
+        """Isolate the cache dir and force the sidecar path for small indexes."""
+        monkeypatch.setenv('RX_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr('rx.unified_index.SIDECAR_LINE_INDEX_THRESHOLD', 10)
+
+    def test_sidecar_roundtrip(self, temp_text_file, low_threshold):
+        """Test that line_index survives a save/load through the sidecar."""
+        import json
+
+        index = self._make_index(temp_text_file)
+        assert save_index(index) is True
+
+        cache_path = get_index_path(temp_text_file)
+        sidecar_path = cache_path.with_suffix('.idx')
+        assert sidecar_path.exists()
+        assert 'line_index' not in json.loads(cache_path.read_bytes())
+
+        loaded = load_index(temp_text_file)
+        assert loaded is not None
+        assert loaded.line_index == index.line_index
+
+    def test_deleted_sidecar_returns_none(self, temp_text_file, low_threshold):
+        """Test that a missing sidecar invalidates the index instead of serving it."""
+        index = self._make_index(temp_text_file)
+        assert save_index(index) is True
+
+        get_index_path(temp_text_file).with_suffix('.idx').unlink()
+
+        assert load_index(temp_text_file) is None
+
+    def test_truncated_sidecar_returns_none(self, temp_text_file, low_threshold):
+        """Test that a truncated sidecar invalidates the index instead of serving part of it."""
+        index = self._make_index(temp_text_file)
+        assert save_index(index) is True
+
+        sidecar_path = get_index_path(temp_text_file).with_suffix('.idx')
+        sidecar_path.write_bytes(sidecar_path.read_bytes()[:10])
+
+        assert load_index(temp_text_file) is None
+
+    def test_small_index_stays_inline(self, temp_text_file, low_threshold):
+        """Test that indexes under the threshold keep line_index in the JSON."""
+        import json
+
+        index = self._make_index(temp_text_file, checkpoints=5)
+        assert save_index(index) is True
+
+        cache_path = get_index_path(temp_text_file)
+        assert not cache_path.with_suffix('.idx').exists()
+        assert json.loads(cache_path.read_bytes())['line_index'] == index.line_index
+
+        loaded = load_index(temp_text_file)
+        assert loaded is not None
+        assert loaded.line_index == index.line_index
+
+
 class TestDeleteIndex:
     """Tests for delete_index function."""
 